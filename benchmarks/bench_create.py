@@ -0,0 +1,301 @@
+"""
+Benchmark "fastapi-create create" across the full option matrix.
+
+Every combination of thread type, database, authentication system and email
+verification is generated non-interactively through the same steps as the
+create command (see fastapi_create.main.get_create_steps), with dependency
+resolution and installation stubbed out. Each run happens in a fresh process,
+so the time and peak RSS of every case include importing fastapi-create and
+compiling its templates, exactly as a real run would.
+
+Results are stored as JSON (one file per run) so they can be compared over time:
+
+    python benchmarks/bench_create.py --repeat 5
+    python benchmarks/bench_create.py --compare benchmarks/results/<previous>.json
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+import itertools
+import json
+import multiprocessing
+import os
+from pathlib import Path
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any
+import typer
+from rich import print
+from rich.table import Table
+
+ROOT = Path(__file__).resolve().parent.parent
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+THREAD_TYPES = ["async", "sync"]
+DATABASES = ["postgresql", "mysql", "sqlite", "mariadb"]
+AUTH_SYSTEMS = ["jwt", "session"]
+VERIFICATION = [True, False]
+
+## Lockfile written instead of resolving dependencies
+STUB_REQUIREMENTS = "fastapi==0.115.0\n"
+
+app = typer.Typer()
+
+
+def get_cases() -> dict[str, dict[str, Any]]:
+    """
+    Get the answers of every case of the option matrix.
+
+    Returns:
+        dict[str, dict[str, Any]]: The answers of each case, keyed by case name.
+    """
+    cases = {}
+    for thread_type, database, auth_system, verification in itertools.product(
+        THREAD_TYPES, DATABASES, AUTH_SYSTEMS, VERIFICATION
+    ):
+        name = "-".join(
+            [
+                thread_type,
+                database,
+                auth_system,
+                "verify" if verification else "noverify",
+            ]
+        )
+        cases[name] = {
+            "thread_type": thread_type,
+            "database": database,
+            "database_path": "app.db",
+            "database_url": "user:password@localhost/app",
+            "smtp_host": "smtp.example.com",
+            "smtp_port": 587,
+            "smtp_login": "user@example.com",
+            "smtp_password": "password",
+            "auth_system": auth_system,
+            "auth_model": "User",
+            "auth_required_fields": ["username", "email"],
+            "auth_login_field": "email",
+            "email_verification": verification,
+        }
+    return cases
+
+
+def get_peak_rss_mib() -> float | None:
+    """
+    Get the peak resident set size of the current process.
+
+    Returns:
+        float | None: The peak RSS in MiB, or None if it cannot be measured on this platform.
+    """
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_case(answers: dict[str, Any]) -> dict[str, Any]:
+    """
+    Create one project in a temporary directory and measure it.
+
+    This runs in a fresh worker process. Output is discarded so printing does
+    not dominate the measurement.
+
+    Args:
+        answers (dict[str, Any]): The answers of the case.
+
+    Returns:
+        dict[str, Any]: The total time, the time of each step and the peak RSS.
+    """
+    sys.path.insert(0, str(ROOT))
+    sys.stdout = open(os.devnull, "w")
+    start = time.perf_counter()
+
+    import fastapi_create.main as main
+    from fastapi_create.answers_setup import collect_answers
+    from fastapi_create.pipeline import run_steps
+
+    main.resolve_dependencies = lambda *args, **kwargs: STUB_REQUIREMENTS
+    main.install_dependencies = lambda *args, **kwargs: None
+    imported = time.perf_counter()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        project_answers = collect_answers(answers, assume_yes=True)
+        steps = main.get_create_steps(str(Path(temp_dir) / "project"), project_answers)
+        _, timings = run_steps(steps)
+    end = time.perf_counter()
+
+    return {
+        "total": end - start,
+        "steps": {
+            "import": imported - start,
+            **{
+                name: step_end - step_start
+                for name, (step_start, step_end) in timings.items()
+            },
+        },
+        "peak_rss_mib": get_peak_rss_mib(),
+    }
+
+
+def summarize(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    """
+    Summarize the repeated runs of a case by their median times and largest peak RSS.
+
+    Args:
+        runs (list[dict[str, Any]]): The results of run_case for each repetition.
+
+    Returns:
+        dict[str, Any]: The summarized result of the case.
+    """
+    rss = [run["peak_rss_mib"] for run in runs if run["peak_rss_mib"] is not None]
+    return {
+        "total": statistics.median(run["total"] for run in runs),
+        "steps": {
+            name: statistics.median(run["steps"][name] for run in runs)
+            for name in runs[0]["steps"]
+        },
+        "peak_rss_mib": max(rss) if rss else None,
+        "runs": len(runs),
+    }
+
+
+def get_git_revision() -> str | None:
+    """
+    Get the git revision of the benchmarked tree.
+
+    Returns:
+        str | None: The commit hash, with a "-dirty" suffix if the tree has
+                    uncommitted changes, or None outside a git checkout.
+    """
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return f"{revision}-dirty" if dirty else revision
+
+
+def print_report(
+    cases: dict[str, dict[str, Any]], baseline: dict[str, Any] | None
+) -> None:
+    """
+    Print the result of each case, compared with a baseline if one is given.
+
+    Args:
+        cases (dict[str, dict[str, Any]]): The summarized result of each case.
+        baseline (dict[str, Any] | None): Previously stored results to compare with.
+    """
+    table = Table(title="fastapi-create create")
+    table.add_column("Case")
+    table.add_column("Total", justify="right")
+    table.add_column("Slowest step", justify="right")
+    table.add_column("Peak RSS", justify="right")
+    if baseline:
+        table.add_column("Baseline", justify="right")
+        table.add_column("Change", justify="right")
+    for name, result in cases.items():
+        slowest = max(result["steps"], key=lambda step: result["steps"][step])
+        row = [
+            name,
+            f"{result['total'] * 1000:.1f}ms",
+            f"{slowest} {result['steps'][slowest] * 1000:.1f}ms",
+            f"{result['peak_rss_mib']:.1f}MiB" if result["peak_rss_mib"] else "-",
+        ]
+        if baseline:
+            previous = baseline["cases"].get(name)
+            if previous:
+                change = (result["total"] - previous["total"]) / previous["total"]
+                color = (
+                    "red" if change > 0.05 else "green" if change < -0.05 else "white"
+                )
+                row += [
+                    f"{previous['total'] * 1000:.1f}ms",
+                    f"[{color}]{change:+.1%}[/{color}]",
+                ]
+            else:
+                row += ["-", "-"]
+        table.add_row(*row)
+    print(table)
+
+    steps = Table(title="Median step time across cases")
+    steps.add_column("Step")
+    steps.add_column("Time", justify="right")
+    step_names = sorted({step for result in cases.values() for step in result["steps"]})
+    for step in step_names:
+        times = [r["steps"][step] for r in cases.values() if step in r["steps"]]
+        steps.add_row(step, f"{statistics.median(times) * 1000:.2f}ms")
+    print(steps)
+
+
+@app.command()
+def main(
+    repeat: int = typer.Option(3, min=1, help="Number of runs of each case."),
+    case_filter: str = typer.Option(
+        "", "--filter", help="Only run the cases whose name contains this string."
+    ),
+    output: Path = typer.Option(
+        RESULTS_DIR, help="Directory where results are stored."
+    ),
+    compare: Path | None = typer.Option(None, help="Stored results to compare with."),
+):
+    """Benchmark project generation across the option matrix."""
+    cases = {
+        name: answers for name, answers in get_cases().items() if case_filter in name
+    }
+    if not cases:
+        print(f"[red]Error: No case matches '{case_filter}'[/red]")
+        raise typer.Exit(code=1)
+    baseline = json.loads(compare.read_text()) if compare else None
+
+    print(f"[yellow]Running {len(cases)} cases {repeat} times each...[/yellow]")
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for name, answers in cases.items():
+        runs = []
+        for _ in range(repeat):
+            # A new executor per run gives every run a fresh process
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                runs.append(executor.submit(run_case, answers).result())
+        results[name] = summarize(runs)
+
+    print_report(results, baseline)
+
+    output.mkdir(parents=True, exist_ok=True)
+    timestamp = datetime.now(timezone.utc)
+    result_path = output / f"{timestamp:%Y%m%dT%H%M%SZ}.json"
+    result_path.write_text(
+        json.dumps(
+            {
+                "timestamp": timestamp.isoformat(),
+                "revision": get_git_revision(),
+                "python": sys.version,
+                "platform": platform.platform(),
+                "repeat": repeat,
+                "cases": results,
+            },
+            indent=2,
+        )
+    )
+    print(f"[green]Results stored in {result_path}[/green]")
+
+
+if __name__ == "__main__":
+    app()
@@ -1,14 +1,15 @@
 from pathlib import Path
-import subprocess
+from typing import Any
 import typer
 from rich import print
 from rich.prompt import Prompt
 from fastapi_create.utils import (
     generate_file_content,
-    write_file,
+    get_answer,
     recursive_prompt_with_validation,
 )
 from fastapi_create.constants import PROJECT_NAME_REGEX
+from fastapi_create.project_setup import ProjectPlan
 
 
 def validate_alembic_folder_name(folder_name: str) -> bool:
@@ -21,7 +22,7 @@ def validate_alembic_folder_name(folder_name: str) -> bool:
     Returns:
         bool: True if the folder name is valid, False otherwise.
     """
-    if not PROJECT_NAME_REGEX.match(folder_name):
+    if not isinstance(folder_name, str) or not PROJECT_NAME_REGEX.match(folder_name):
         print(
             "[red]Error: Invalid Alembic folder name. Must be a valid directory name.[/red]"
         )
@@ -29,17 +30,32 @@ def validate_alembic_folder_name(folder_name: str) -> bool:
     return True
 
 
-def alembic_folder_name_prompt() -> str:
+def alembic_folder_name_prompt(
+    answers: dict[str, Any] | None = None, assume_yes: bool = False
+) -> str:
     """
     Prompt the user to enter the name of the Alembic folder.
 
+    Args:
+        answers (dict[str, Any] | None): Answers provided upfront. If it contains an
+                                         "alembic_folder" key, the user is not prompted.
+                                         Defaults to None.
+        assume_yes (bool): Whether to use the default instead of prompting. Defaults to False.
+
     Returns:
         str: The name of the Alembic folder entered by the user, or the default value "alembic" if no input is provided.
     """
-    return recursive_prompt_with_validation(
-        prompt="Enter the name of the Alembic folder",
+    return get_answer(
+        answers or {},
+        "alembic_folder",
+        lambda: recursive_prompt_with_validation(
+            prompt="Enter the name of the Alembic folder",
+            validation_func=validate_alembic_folder_name,
+            prompt_kwargs={"default": "alembic"},
+        ),
+        assume_yes,
+        default="alembic",
         validation_func=validate_alembic_folder_name,
-        prompt_kwargs={"default": "alembic"},
     )
 
 
@@ -57,31 +73,35 @@ def generate_alembic_env_code(is_async: bool) -> str:
     return generate_file_content("alembic_env_template.py.jinja2", is_async=is_async)
 
 
-def alembic_setup(folder_name: str, base_path: Path, is_async: bool = True) -> None:
+def alembic_setup(folder_name: str, plan: ProjectPlan, is_async: bool = True) -> None:
     """
-    Initialize Alembic and configure the env.py file.
+    Add the Alembic scaffold to the project plan.
 
-    This function initializes Alembic in the specified folder and configures
-    the env.py file for asynchronous database operations.
+    This function renders the files "alembic init" would create, with the env.py
+    file configured for the project's database operations. Nothing is run in a
+    subprocess, so Alembic does not need to be installed.
 
     Args:
         folder_name (str): The name of the folder where Alembic will be initialized.
-        base_path (Path): The base path where the folder is located.
+        plan (ProjectPlan): The plan of the project the Alembic files are added to.
         is_async (bool): Whether the application is using asynchronous database operations.
                          If True, the database operations will be asynchronous. Defaults to True.
-
-    Raises:
-        RuntimeError: If there is an error during the initialization of Alembic.
-
     """
-    print("[yellow]Initializing Alembic...[/yellow]")
-    try:
-        subprocess.run(["alembic", "init", folder_name], cwd=base_path, check=True)
-    except subprocess.CalledProcessError:
-        print("[red]Error initializing Alembic[/red]", file="stderr")
-        raise RuntimeError("Error initializing Alembic")
-    print("[green]Alembic initialized successfully[/green]")
-    env_path = base_path / folder_name / "env.py"
-    env_code = generate_alembic_env_code(is_async)
-    write_file(env_path, env_code)
-    print("[green]Alembic env.py configured successfully[/green]")
+    alembic_path = Path(folder_name)
+    configs: list[tuple[str, Path, dict]] = [
+        (
+            "alembic_ini_template.ini.jinja2",
+            Path("alembic.ini"),
+            {"folder_name": folder_name},
+        ),
+        (
+            "alembic_readme_template.jinja2",
+            alembic_path / "README",
+            {"is_async": is_async},
+        ),
+        ("alembic_script_template.py.mako.jinja2", alembic_path / "script.py.mako", {}),
+    ]
+    for template_name, path, kwargs in configs:
+        plan.add_file(path, generate_file_content(template_name, **kwargs))
+    plan.add_file(alembic_path / "env.py", generate_alembic_env_code(is_async))
+    plan.add_directory(alembic_path / "versions")
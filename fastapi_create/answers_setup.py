@@ -0,0 +1,250 @@
+from dataclasses import dataclass
+from pathlib import Path
+import sys
+from typing import Any
+from rich.prompt import Prompt, Confirm
+from fastapi_create.alembic_setup import alembic_folder_name_prompt
+from fastapi_create.auth_setup import handle_auth_setup
+from fastapi_create.database_setup import configure_database
+from fastapi_create.smtp_setup import smtp_settings_prompt
+from fastapi_create.utils import get_answer
+
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
+
+
+@dataclass
+class ProjectAnswers:
+    """The answers to every configuration question asked when creating a project."""
+
+    is_async: bool
+    db_dependency: str | None
+    db_url: str
+    smtp_settings: dict[str, Any] | None
+    auth_system: str | None
+    auth_model: str | None
+    required_fields: set[str] | None
+    login_field: str | None
+    verification_enabled: bool
+    alembic_folder_name: str | None
+    cors_enabled: bool
+    read_replicas_enabled: bool = False
+    stateless_jwt_enabled: bool = False
+
+    @property
+    def smtp_enabled(self) -> bool:
+        return self.smtp_settings is not None
+
+    @property
+    def auth_enabled(self) -> bool:
+        return self.auth_system is not None
+
+    @property
+    def alembic_include(self) -> bool:
+        return self.alembic_folder_name is not None
+
+    @property
+    def username_is_required(self) -> bool:
+        return "username" in (self.required_fields or ())
+
+    @property
+    def email_is_required(self) -> bool:
+        return "email" in (self.required_fields or ())
+
+    @property
+    def phone_is_required(self) -> bool:
+        return "phone" in (self.required_fields or ())
+
+
+def load_answers_file(path: Path) -> dict[str, Any]:
+    """
+    Load answers from a TOML file.
+
+    Args:
+        path (Path): The path to the TOML file.
+
+    Returns:
+        dict[str, Any]: The answers, keyed by question.
+
+    Raises:
+        ValueError: If the file cannot be read or is not valid TOML.
+    """
+    try:
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    except (OSError, tomllib.TOMLDecodeError) as e:
+        raise ValueError(f"Could not load answers from {path}: {e}")
+
+
+def collect_answers(
+    answers: dict[str, Any] | None = None, assume_yes: bool = False
+) -> ProjectAnswers:
+    """
+    Collect the answers to every configuration question.
+
+    Questions answered in answers are not prompted for. With assume_yes, the
+    remaining questions are answered with their defaults, so no prompt is shown
+    at all. Questions without a default must then be answered in answers.
+
+    The supported answer keys are: "thread_type" ("async" or "sync"), "database",
+    "database_path", "database_url", "smtp", "smtp_host", "smtp_port",
+    "smtp_login", "smtp_password", "auth", "auth_system" ("jwt" or "session"),
+    "auth_model", "auth_required_fields", "auth_login_field",
+    "stateless_jwt", "email_verification", "alembic", "alembic_folder", "cors"
+    and "read_replicas".
+
+    Args:
+        answers (dict[str, Any] | None): Answers provided upfront. Defaults to None.
+        assume_yes (bool): Whether to use defaults instead of prompting. Defaults to False.
+
+    Returns:
+        ProjectAnswers: The collected answers.
+
+    Raises:
+        ValueError: If a provided answer is invalid, or if assume_yes is set and
+                    an answer without a default is missing.
+    """
+    answers = answers or {}
+
+    ## Prompt user for thread type
+    thread_type = get_answer(
+        answers,
+        "thread_type",
+        lambda: Prompt.ask(
+            "Do you want your FastAPI application to be synchronous or asynchronous?",
+            choices=["async", "sync"],
+            default="async",
+        ),
+        assume_yes,
+        default="async",
+        validation_func=lambda value: value in ["async", "sync"],
+    )
+    is_async = thread_type == "async"
+
+    ## Prompt user for database configuration
+    db_dependency, db_url = configure_database(is_async, answers, assume_yes)
+
+    ## Prompt user for read replica configuration
+    read_replicas_enabled = (
+        get_answer(
+            answers,
+            "read_replicas",
+            lambda: Confirm.ask(
+                "Do you want to route read-only queries to read replicas?",
+                default=False,
+            ),
+            assume_yes,
+            default=False,
+        )
+        if not db_url.startswith("sqlite")
+        else False
+    )
+
+    ## Prompt user for SMTP configuration
+    smtp_enabled, smtp_settings = smtp_settings_prompt(answers, assume_yes)
+
+    ## Prompt user for Auth configuration
+    auth_enabled = get_answer(
+        answers,
+        "auth",
+        lambda: Confirm.ask(
+            "Do you want to include authentication and authorization?", default=True
+        ),
+        assume_yes,
+        default=True,
+    )
+    auth_system, auth_model, required_fields, login_field = None, None, None, None
+    verification_enabled, stateless_jwt_enabled = False, False
+    if auth_enabled:
+        auth_system = get_answer(
+            answers,
+            "auth_system",
+            lambda: Prompt.ask(
+                "Which authentication system do you want to use?",
+                choices=["JWT", "Session"],
+                default="JWT",
+                case_sensitive=False,
+            ),
+            assume_yes,
+            default="jwt",
+            validation_func=lambda value: isinstance(value, str)
+            and value.lower() in ["jwt", "session"],
+        ).lower()
+        stateless_jwt_enabled = (
+            get_answer(
+                answers,
+                "stateless_jwt",
+                lambda: Confirm.ask(
+                    "Do you want to authorize requests from JWT claims alone, with short-lived access tokens and refresh tokens?",
+                    default=False,
+                ),
+                assume_yes,
+                default=False,
+            )
+            if auth_system == "jwt"
+            else False
+        )
+        auth_model, required_fields, login_field = handle_auth_setup(
+            answers, assume_yes
+        )
+        verification_enabled = (
+            get_answer(
+                answers,
+                "email_verification",
+                lambda: Confirm.ask(
+                    "Do you want to include email verification for user registration?",
+                    default=True,
+                ),
+                assume_yes,
+                default=True,
+            )
+            if smtp_enabled
+            else False
+        )
+
+    ## Prompt user for alembic configuration
+    alembic_include = get_answer(
+        answers,
+        "alembic",
+        lambda: Confirm.ask(
+            "Do you want to include Alembic migrations?",
+            default=True,
+        ),
+        assume_yes,
+        default=True,
+    )
+
+    ## Prompt user for alembic folder name
+    alembic_folder_name = (
+        alembic_folder_name_prompt(answers, assume_yes) if alembic_include else None
+    )
+
+    ## Prompt user for CORS configuration
+    cors_enabled = get_answer(
+        answers,
+        "cors",
+        lambda: Confirm.ask(
+            "Do you want to include CORS middleware?",
+            default=True,
+        ),
+        assume_yes,
+        default=True,
+    )
+
+    return ProjectAnswers(
+        is_async=is_async,
+        db_dependency=db_dependency,
+        db_url=db_url,
+        smtp_settings=smtp_settings,
+        auth_system=auth_system,
+        auth_model=auth_model,
+        required_fields=required_fields,
+        login_field=login_field,
+        verification_enabled=verification_enabled,
+        alembic_folder_name=alembic_folder_name,
+        cors_enabled=cors_enabled,
+        read_replicas_enabled=read_replicas_enabled,
+        stateless_jwt_enabled=stateless_jwt_enabled,
+    )
@@ -1,6 +1,7 @@
 from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file, get_plural_name
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content, get_plural_name
 
 
 def generate_db_models_code(
@@ -11,6 +12,7 @@ def generate_db_models_code(
     phone_is_required: bool,
     username_is_required: bool,
     verification_enabled: bool,
+    stateless_jwt_enabled: bool = False,
 ) -> str:
     """
     Generate database models code from a template.
@@ -27,6 +29,8 @@ def generate_db_models_code(
         phone_is_required (bool): Whether the phone field is required.
         username_is_required (bool): Whether the username field is required.
         verification_enabled (bool): Whether email verification is enabled.
+        stateless_jwt_enabled (bool): Whether the model has roles and token claims.
+                                      Defaults to False.
 
     Returns:
         str: The generated database models code as a string.
@@ -42,11 +46,12 @@ def generate_db_models_code(
         phone_is_required=phone_is_required,
         username_is_required=username_is_required,
         verification_enabled=verification_enabled,
+        stateless_jwt_enabled=stateless_jwt_enabled,
     )
 
 
 def configure_db_models_in_project(
-    base_path: Path,
+    plan: ProjectPlan,
     auth_model: str,
     login_field: str | None,
     is_async: bool,
@@ -54,15 +59,16 @@ def configure_db_models_in_project(
     phone_is_required: bool,
     username_is_required: bool,
     verification_enabled: bool,
+    stateless_jwt_enabled: bool = False,
 ):
     """
     Configure database models in the project.
 
-    This function generates the database models code and writes it to a file
-    in the project directory.
+    This function generates the database models code and adds it to a file
+    of the project plan.
 
     Args:
-        base_path (Path): The base path of the project directory.
+        plan (ProjectPlan): The plan of the project.
         auth_model (str): The name of the authentication model.
         login_field (str): The field used for login (e.g., "email" or "username").
         is_async (bool): Whether the application is using asynchronous dependencies.
@@ -70,10 +76,11 @@ def configure_db_models_in_project(
         phone_is_required (bool): Whether the phone field is required.
         username_is_required (bool): Whether the username field is required.
         verification_enabled (bool): Whether email verification is enabled.
+        stateless_jwt_enabled (bool): Whether the model has roles and token claims.
+                                      Defaults to False.
     """
-    db_models_path = base_path / "app" / "db" / "models.py"
-    print(f"[yellow]Configuring database models in {db_models_path}...[/yellow]")
-    write_file(
+    db_models_path = Path("app") / "db" / "models.py"
+    plan.add_file(
         db_models_path,
         generate_db_models_code(
             auth_model=auth_model,
@@ -83,6 +90,6 @@ def configure_db_models_in_project(
             phone_is_required=phone_is_required,
             username_is_required=username_is_required,
             verification_enabled=verification_enabled,
+            stateless_jwt_enabled=stateless_jwt_enabled,
         ),
     )
-    print("[green]Database models configured successfully![/green]")
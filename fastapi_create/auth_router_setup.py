@@ -1,6 +1,7 @@
 from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file, get_plural_name
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content, get_plural_name
 
 
 def generate_auth_router_code(
@@ -12,6 +13,8 @@ def generate_auth_router_code(
     phone_is_required: bool,
     username_is_required: bool,
     verification_enabled: bool,
+    read_replicas_enabled: bool = False,
+    stateless_jwt_enabled: bool = False,
 ) -> str:
     """
     Generate authentication router code from a template.
@@ -30,6 +33,11 @@ def generate_auth_router_code(
         phone_is_required (bool): Whether the phone field is required.
         username_is_required (bool): Whether the username field is required.
         verification_enabled (bool): Whether email verification is enabled.
+        read_replicas_enabled (bool): Whether login looks up the user on a read replica.
+                                      Defaults to False.
+        stateless_jwt_enabled (bool): Whether access tokens carry the authorization claims
+                                      and a refresh endpoint is generated.
+                                      Defaults to False.
 
     Returns:
         str: The generated authentication router code as a string.
@@ -47,11 +55,13 @@ def generate_auth_router_code(
         phone_is_required=phone_is_required,
         username_is_required=username_is_required,
         verification_enabled=verification_enabled,
+        read_replicas_enabled=read_replicas_enabled,
+        stateless_jwt_enabled=stateless_jwt_enabled,
     )
 
 
 def configure_auth_router_in_project(
-    base_path: Path,
+    plan: ProjectPlan,
     auth_model: str,
     auth_system: str,
     login_field: str,
@@ -60,16 +70,18 @@ def configure_auth_router_in_project(
     username_is_required: bool,
     is_async: bool,
     verification_enabled: bool,
+    read_replicas_enabled: bool = False,
+    stateless_jwt_enabled: bool = False,
 ) -> None:
     """
-    Write authentication router to the project.
+    Add authentication router to the project plan.
 
-    This function generates the authentication router code and writes it to the
-    appropriate file within the project directory structure.
+    This function generates the authentication router code and adds it to the
+    appropriate file of the project plan.
 
     Args:
-        base_path (Path): The base path of the project where the authentication router
-                          file will be created.
+        plan (ProjectPlan): The plan of the project the authentication router
+                            file is added to.
         auth_model (str): The name of the authentication model.
         auth_system (str): The authentication system being used.
         login_field (str): The field used for login.
@@ -79,13 +91,17 @@ def configure_auth_router_in_project(
         is_async (bool): Whether the application is using asynchronous dependencies.
                          If True, the dependencies will be asynchronous.
         verification_enabled (bool): Whether email verification is enabled.
+        read_replicas_enabled (bool): Whether login looks up the user on a read replica.
+                                      Defaults to False.
+        stateless_jwt_enabled (bool): Whether access tokens carry the authorization claims
+                                      and a refresh endpoint is generated.
+                                      Defaults to False.
 
     Returns:
         None
     """
-    router_path = base_path / "app" / "routes" / "auth.py"
-    print("[yellow]Writing authentication router to the project...[/yellow]")
-    write_file(
+    router_path = Path("app") / "routes" / "auth.py"
+    plan.add_file(
         router_path,
         generate_auth_router_code(
             auth_model,
@@ -96,6 +112,7 @@ def configure_auth_router_in_project(
             phone_is_required,
             username_is_required,
             verification_enabled,
+            read_replicas_enabled,
+            stateless_jwt_enabled,
         ),
     )
-    print("[green]Authentication router written successfully[/green]")
@@ -1,6 +1,7 @@
 from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file, get_plural_name
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content, get_plural_name
 
 
 def generate_auth_schema_code(
@@ -11,6 +12,7 @@ def generate_auth_schema_code(
     phone_is_required: bool,
     username_is_required: bool,
     verification_enabled: bool,
+    stateless_jwt_enabled: bool = False,
 ) -> str:
     """
     Generate authentication schema code from a template.
@@ -27,6 +29,8 @@ def generate_auth_schema_code(
         phone_is_required (bool): Whether the phone field is required.
         username_is_required (bool): Whether the username field is required.
         verification_enabled (bool): Whether email verification is enabled.
+        stateless_jwt_enabled (bool): Whether the token claims schema is generated.
+                                      Defaults to False.
 
     Returns:
         str: The generated authentication schema code as a string.
@@ -41,11 +45,12 @@ def generate_auth_schema_code(
         phone_is_required=phone_is_required,
         username_is_required=username_is_required,
         verification_enabled=verification_enabled,
+        stateless_jwt_enabled=stateless_jwt_enabled,
     )
 
 
 def configure_auth_schema_in_project(
-    base_path: Path,
+    plan: ProjectPlan,
     auth_model: str,
     auth_system: str,
     login_field: str,
@@ -53,16 +58,17 @@ def configure_auth_schema_in_project(
     phone_is_required: bool,
     username_is_required: bool,
     verification_enabled: bool,
+    stateless_jwt_enabled: bool = False,
 ) -> None:
     """
-    Write authentication schema to the project.
+    Add authentication schema to the project plan.
 
-    This function generates the authentication schema code and writes it to the
-    appropriate file within the project directory structure.
+    This function generates the authentication schema code and adds it to the
+    appropriate file of the project plan.
 
     Args:
-        base_path (Path): The base path of the project where the authentication schema
-                          file will be created.
+        plan (ProjectPlan): The plan of the project the authentication schema
+                            file is added to.
         auth_model (str): The name of the authentication model.
         auth_system (str): The authentication system being used.
         login_field (str): The field used for login.
@@ -70,15 +76,16 @@ def configure_auth_schema_in_project(
         phone_is_required (bool): Whether the phone field is required.
         username_is_required (bool): Whether the username field is required.
         verification_enabled (bool): Whether email verification is enabled.
+        stateless_jwt_enabled (bool): Whether the token claims schema is generated.
+                                      Defaults to False.
 
     Returns:
         None
     """
     schema_path = (
-        base_path / "app" / "schemas" / f"{get_plural_name(auth_model).lower()}.py"
+        Path("app") / "schemas" / f"{get_plural_name(auth_model).lower()}.py"
     )
-    print("[yellow]Writing authentication schema to the project...[/yellow]")
-    write_file(
+    plan.add_file(
         schema_path,
         generate_auth_schema_code(
             auth_model=auth_model,
@@ -88,6 +95,6 @@ def configure_auth_schema_in_project(
             phone_is_required=phone_is_required,
             username_is_required=username_is_required,
             verification_enabled=verification_enabled,
+            stateless_jwt_enabled=stateless_jwt_enabled,
         ),
     )
-    print("[green]Authentication schema written successfully[/green]")
@@ -1,5 +1,6 @@
+from typing import Any
 from rich.prompt import Prompt
-from fastapi_create.utils import recursive_prompt_with_validation
+from fastapi_create.utils import get_answer, recursive_prompt_with_validation
 
 
 def validate_auth_required_fields(required_fields: str) -> bool:
@@ -14,7 +15,7 @@ def validate_auth_required_fields(required_fields: str) -> bool:
     Returns:
         bool: A boolean indicating whether the required fields are valid.
     """
-    return all(
+    return isinstance(required_fields, str) and all(
         field.strip() in ["email", "username", "phone"]
         for field in required_fields.split(",")
     )
@@ -47,26 +48,84 @@ def validate_auth_model(auth_model: str) -> bool:
     Returns:
         bool: A boolean indicating whether the authentication model is valid.
     """
-    return auth_model.isidentifier()
+    return isinstance(auth_model, str) and auth_model.isidentifier()
 
 
-def handle_auth_setup():
+def get_default_login_field(required_fields: set[str]) -> str:
+    """
+    Get the login field used when none is chosen explicitly.
+
+    Args:
+        required_fields (set[str]): The required fields for authentication.
+
+    Returns:
+        str: "email" if it is a required field, otherwise the first required field
+             in alphabetical order.
+    """
+    return "email" if "email" in required_fields else sorted(required_fields)[0]
+
+
+def handle_auth_setup(
+    answers: dict[str, Any] | None = None, assume_yes: bool = False
+) -> tuple[str, set[str], str]:
+    """
+    Prompt the user for the authentication model configuration.
+
+    Questions answered in answers (under the "auth_model", "auth_required_fields"
+    and "auth_login_field" keys) are not prompted for. "auth_required_fields"
+    may be a list or a comma-separated string.
+
+    Args:
+        answers (dict[str, Any] | None): Answers provided upfront. Defaults to None.
+        assume_yes (bool): Whether to use defaults instead of prompting. Defaults to False.
+
+    Returns:
+        tuple[str, set[str], str]: The authentication model name, the required
+                                   fields and the login field.
+    """
+    answers = dict(answers or {})
+    required_fields = answers.get("auth_required_fields")
+    if isinstance(required_fields, list) and all(
+        isinstance(field, str) for field in required_fields
+    ):
+        answers["auth_required_fields"] = ",".join(answers["auth_required_fields"])
 
     # Prompt user for Auth configuration
-    auth_model = recursive_prompt_with_validation(
-        prompt="Enter the name of the authentication model",
+    auth_model = get_answer(
+        answers,
+        "auth_model",
+        lambda: recursive_prompt_with_validation(
+            prompt="Enter the name of the authentication model",
+            validation_func=validate_auth_model,
+            prompt_kwargs={"default": "User"},
+        ),
+        assume_yes,
+        default="User",
         validation_func=validate_auth_model,
-        prompt_kwargs={"default": "User"},
     )
-    required_fields = recursive_prompt_with_validation(
-        prompt="Which fields are required for signup? (Choose a comma-separated list of 'email', 'username', 'phone')",
+    required_fields = get_answer(
+        answers,
+        "auth_required_fields",
+        lambda: recursive_prompt_with_validation(
+            prompt="Which fields are required for signup? (Choose a comma-separated list of 'email', 'username', 'phone')",
+            validation_func=validate_auth_required_fields,
+            prompt_kwargs={"default": "email"},
+        ),
+        assume_yes,
+        default="email",
         validation_func=validate_auth_required_fields,
-        prompt_kwargs={"default": "email"},
     )
     required_fields = clean_auth_required_fields(required_fields)
-    login_field = Prompt.ask(
-        "Which field should be used for login?",
-        choices=list(required_fields),
+    login_field = get_answer(
+        answers,
+        "auth_login_field",
+        lambda: Prompt.ask(
+            "Which field should be used for login?",
+            choices=list(required_fields),
+        ),
+        assume_yes,
+        default=get_default_login_field(required_fields),
+        validation_func=lambda value: value in required_fields,
     )
 
     return auth_model, required_fields, login_field
@@ -1,6 +1,7 @@
 from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content
 
 
 def generate_core_config_code(
@@ -8,6 +9,10 @@ def generate_core_config_code(
     cors_enabled: bool,
     smtp_enabled: bool,
     verification_enabled: bool,
+    read_replicas_enabled: bool = False,
+    stateless_jwt_enabled: bool = False,
+    alembic_include: bool = False,
+    is_async: bool = False,
 ) -> str:
     """
     Generate core configuration code from a template.
@@ -25,6 +30,16 @@ def generate_core_config_code(
                                 for sending emails.
         verification_enabled (bool): Whether email verification settings are enabled in the configuration.
                                      If True, the configuration will include email verification settings.
+        read_replicas_enabled (bool): Whether read replica settings are enabled in the configuration.
+                                      Defaults to False.
+        stateless_jwt_enabled (bool): Whether refresh token settings are enabled in the configuration.
+                                      Defaults to False.
+        alembic_include (bool): Whether the project uses Alembic migrations. If True, the
+                                database schema is checked instead of created on startup.
+                                Defaults to False.
+        is_async (bool): Whether the application is using asynchronous dependencies.
+                         If True, the configuration will include the password hashing pool size.
+                         Defaults to False.
 
     Returns:
         str: The generated core configuration code as a string.
@@ -36,25 +51,33 @@ def generate_core_config_code(
         cors_enabled=cors_enabled,
         auth_system=auth_system,
         verification_enabled=verification_enabled,
+        read_replicas_enabled=read_replicas_enabled,
+        stateless_jwt_enabled=stateless_jwt_enabled,
+        alembic_include=alembic_include,
+        is_async=is_async,
     )
 
 
 def configure_core_config_in_project(
-    base_path: Path,
+    plan: ProjectPlan,
     auth_system: str,
     cors_enabled: bool,
     smtp_enabled: bool,
     verification_enabled: bool,
+    read_replicas_enabled: bool = False,
+    stateless_jwt_enabled: bool = False,
+    alembic_include: bool = False,
+    is_async: bool = False,
 ) -> None:
     """
-    Write core configuration to the project.
+    Add core configuration to the project plan.
 
-    This function generates the core configuration code and writes it to the
-    appropriate file within the project directory structure.
+    This function generates the core configuration code and adds it to the
+    appropriate file of the project plan.
 
     Args:
-        base_path (Path): The base path of the project where the core configuration
-                          file will be created.
+        plan (ProjectPlan): The plan of the project the core configuration file
+                            is added to.
         auth_system (str): The authentication system used in the project.
         cors_enabled (bool): Whether CORS settings are enabled in the configuration.
                              If True, the configuration will include CORS settings.
@@ -65,16 +88,31 @@ def configure_core_config_in_project(
         verification_enabled (bool): Whether email verification settings are enabled in the configuration.
                                      If True, the configuration will include email verification settings.
                                      Defaults to True.
+        read_replicas_enabled (bool): Whether read replica settings are enabled in the configuration.
+                                      Defaults to False.
+        stateless_jwt_enabled (bool): Whether refresh token settings are enabled in the configuration.
+                                      Defaults to False.
+        alembic_include (bool): Whether the project uses Alembic migrations. If True, the
+                                database schema is checked instead of created on startup.
+                                Defaults to False.
+        is_async (bool): Whether the application is using asynchronous dependencies.
+                         If True, the configuration will include the password hashing pool size.
+                         Defaults to False.
 
     Returns:
         None
     """
-    config_path = base_path / "app" / "core" / "config.py"
-    print("[yellow]Writing core config to the project...[/yellow]")
-    write_file(
+    config_path = Path("app") / "core" / "config.py"
+    plan.add_file(
         config_path,
         generate_core_config_code(
-            auth_system, cors_enabled, smtp_enabled, verification_enabled
+            auth_system,
+            cors_enabled,
+            smtp_enabled,
+            verification_enabled,
+            read_replicas_enabled,
+            stateless_jwt_enabled,
+            alembic_include,
+            is_async,
         ),
     )
-    print("[green]Core config written successfully[/green]")
@@ -1,10 +1,15 @@
+from enum import Enum
+import os
 import re
+from pathlib import Path
 
 
 # CONSTANTS
 
 ## Regular expression to validate project names
 PROJECT_NAME_REGEX = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_-]*$")
+## Supported database engines
+DB_ENGINES = ["postgresql", "mysql", "sqlite", "mariadb"]
 ## Regex for validating non-SQLite database connection details
 DB_URL_REGEX = re.compile(
     r"^[a-zA-Z0-9_]+:[^@]+@[a-zA-Z0-9.-]+(?::[0-9]{1,5})?/[a-zA-Z0-9_]+(?:\?.*)?$"
@@ -24,6 +29,26 @@ DEPENDENCIES = [
     "pydantic-settings",
     "pydantic-extra-types",
     "alembic",
-    "passlib[bcrypt]",
+    "passlib[argon2,bcrypt]",
     "phonenumbers",
 ]
+## Database drivers that may be installed depending on the chosen database
+DB_DEPENDENCIES = ["psycopg", "pymysql", "asyncmy", "aiosqlite"]
+
+
+## Directory holding the Jinja2 templates shipped with the package
+TEMPLATES_DIR = Path(__file__).parent / "templates"
+## Directory used to cache artefacts (e.g. compiled templates) between runs
+CACHE_DIR = Path(
+    os.environ.get("FASTAPI_CREATE_CACHE_DIR")
+    or Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "fastapi-create"
+)
+
+
+class Installer(str, Enum):
+    """Backends that can be used to install project dependencies."""
+
+    auto = "auto"
+    pip = "pip"
+    uv = "uv"
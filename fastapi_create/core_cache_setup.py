@@ -0,0 +1,51 @@
+from pathlib import Path
+from rich import print
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content, get_plural_name
+
+
+def generate_core_cache_code(is_async: bool, auth_model: str) -> str:
+    """
+    Generate core cache code from a template.
+
+    This function prints a message indicating that the core cache code is being
+    generated, and then it generates the content of the core cache file using
+    a Jinja2 template.
+
+    Args:
+        is_async (bool): Whether the application is using asynchronous dependencies.
+                         If True, the cache backends will be asynchronous.
+        auth_model (str): The name of the authentication model that is cached.
+
+    Returns:
+        str: The generated core cache code as a string.
+    """
+    print("[yellow]Generating core cache code...[/yellow]")
+    return generate_file_content(
+        "core_cache_template.py.jinja2",
+        is_async=is_async,
+        auth_model=auth_model,
+        auth_model_plural=get_plural_name(auth_model),
+    )
+
+
+def configure_core_cache_in_project(
+    plan: ProjectPlan, is_async: bool, auth_model: str
+) -> None:
+    """
+    Add the core cache to the project plan.
+
+    This function generates the core cache code and adds it to the
+    appropriate file of the project plan.
+
+    Args:
+        plan (ProjectPlan): The plan of the project the core cache file is added to.
+        is_async (bool): Whether the application is using asynchronous dependencies.
+                         If True, the cache backends will be asynchronous.
+        auth_model (str): The name of the authentication model that is cached.
+
+    Returns:
+        None
+    """
+    cache_path = Path("app") / "core" / "cache.py"
+    plan.add_file(cache_path, generate_core_cache_code(is_async, auth_model))
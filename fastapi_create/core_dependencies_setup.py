@@ -1,6 +1,7 @@
 from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content, get_plural_name
 
 
 def generate_core_dependencies_code(
@@ -10,6 +11,8 @@ def generate_core_dependencies_code(
     auth_enabled: bool,
     smtp_enabled: bool,
     verification_enabled: bool,
+    read_replicas_enabled: bool = False,
+    stateless_jwt_enabled: bool = False,
 ) -> str:
     """
     Generate core dependencies code from a template.
@@ -26,6 +29,11 @@ def generate_core_dependencies_code(
         auth_enabled (bool): Whether authentication is enabled.
         smtp_enabled (bool): Whether the application is using SMTP for sending emails.
         verification_enabled (bool): Whether email verification is enabled.
+        read_replicas_enabled (bool): Whether the current user is looked up on a read replica.
+                                      Defaults to False.
+        stateless_jwt_enabled (bool): Whether the current user is authorized from the
+                                      access token claims, without a query.
+                                      Defaults to False.
 
     Returns:
         str: The generated core dependencies code as a string.
@@ -35,31 +43,36 @@ def generate_core_dependencies_code(
         "core_dependencies_template.py.jinja2",
         is_async=is_async,
         auth_model=auth_model,
+        auth_model_plural=get_plural_name(auth_model) if auth_model else None,
         auth_system=auth_system,
         smtp_enabled=smtp_enabled,
         verification_enabled=verification_enabled,
         auth_enabled=auth_enabled,
+        read_replicas_enabled=read_replicas_enabled,
+        stateless_jwt_enabled=stateless_jwt_enabled,
     )
 
 
 def configure_core_dependencies_in_project(
-    base_path: Path,
+    plan: ProjectPlan,
     is_async: bool,
     auth_model: str,
     auth_system: str,
     auth_enabled: bool,
     smtp_enabled: bool,
     verification_enabled: bool,
+    read_replicas_enabled: bool = False,
+    stateless_jwt_enabled: bool = False,
 ) -> None:
     """
-    Write core dependencies to the project.
+    Add core dependencies to the project plan.
 
-    This function generates the core dependencies code and writes it to the
-    appropriate file within the project directory structure.
+    This function generates the core dependencies code and adds it to the
+    appropriate file of the project plan.
 
     Args:
-        base_path (Path): The base path of the project where the core dependencies
-                          file will be created.
+        plan (ProjectPlan): The plan of the project the core dependencies file
+                            is added to.
         is_async (bool): Whether the application is using asynchronous dependencies.
                          If True, the dependencies will be asynchronous. Defaults to True.
         auth_model (str): The authentication model to be used in the application.
@@ -67,12 +80,16 @@ def configure_core_dependencies_in_project(
         auth_enabled (bool): Whether authentication is enabled.
         smtp_enabled (bool): Whether the application is using SMTP for sending emails.
         verification_enabled (bool): Whether email verification is enabled.
+        read_replicas_enabled (bool): Whether the current user is looked up on a read replica.
+                                      Defaults to False.
+        stateless_jwt_enabled (bool): Whether the current user is authorized from the
+                                      access token claims, without a query.
+                                      Defaults to False.
     Returns:
         None
     """
-    dependencies_path = base_path / "app" / "core" / "dependencies.py"
-    print("[yellow]Writing core dependencies to the project...[/yellow]")
-    write_file(
+    dependencies_path = Path("app") / "core" / "dependencies.py"
+    plan.add_file(
         dependencies_path,
         generate_core_dependencies_code(
             is_async,
@@ -81,6 +98,7 @@ def configure_core_dependencies_in_project(
             auth_enabled,
             smtp_enabled,
             verification_enabled,
+            read_replicas_enabled,
+            stateless_jwt_enabled,
         ),
     )
-    print("[green]Core dependencies written successfully[/green]")
@@ -1,11 +1,14 @@
 from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content
 
 
 def generate_core_utils_security_code(
     verification_enabled: bool,
     auth_system: str,
+    stateless_jwt_enabled: bool = False,
+    is_async: bool = False,
 ) -> str:
     """
     Generate core security utilities code from a template.
@@ -17,6 +20,10 @@ def generate_core_utils_security_code(
     Args:
         verification_enabled (bool): Whether email verification is enabled.
         auth_system (str): The authentication system being used.
+        stateless_jwt_enabled (bool): Whether refresh tokens are generated.
+                                      Defaults to False.
+        is_async (bool): Whether the application is using asynchronous dependencies.
+                         If True, awaitable password helpers are generated. Defaults to False.
 
     Returns:
         str: The generated core security utilities code as a string.
@@ -26,34 +33,40 @@ def generate_core_utils_security_code(
         "core_security_template.py.jinja2",
         verification_enabled=verification_enabled,
         auth_system=auth_system,
+        stateless_jwt_enabled=stateless_jwt_enabled,
+        is_async=is_async,
     )
 
 
 def configure_core_utils_security_in_project(
-    base_path: Path,
+    plan: ProjectPlan,
     verification_enabled: bool,
     auth_system: str,
+    stateless_jwt_enabled: bool = False,
+    is_async: bool = False,
 ):
     """
     Configure core security utilities in the project.
 
-    This function generates the core security utilities code and writes it to a file
-    in the project directory.
+    This function generates the core security utilities code and adds it to a file
+    of the project plan.
 
     Args:
-        base_path (Path): The base path of the project directory.
+        plan (ProjectPlan): The plan of the project.
         verification_enabled (bool): Whether email verification is enabled.
         auth_system (str): The authentication system being used.
+        stateless_jwt_enabled (bool): Whether refresh tokens are generated.
+                                      Defaults to False.
+        is_async (bool): Whether the application is using asynchronous dependencies.
+                         If True, awaitable password helpers are generated. Defaults to False.
     """
-    core_utils_security_path = base_path / "app" / "core" / "utils" / "security.py"
-    print(
-        f"[yellow]Configuring core security utilities in {core_utils_security_path}...[/yellow]"
-    )
-    write_file(
+    core_utils_security_path = Path("app") / "core" / "utils" / "security.py"
+    plan.add_file(
         core_utils_security_path,
         generate_core_utils_security_code(
             verification_enabled=verification_enabled,
             auth_system=auth_system,
+            stateless_jwt_enabled=stateless_jwt_enabled,
+            is_async=is_async,
         ),
     )
-    print("[green]Core security utilities configured successfully![/green]")
@@ -1,6 +1,7 @@
 from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content
 
 
 def generate_core_utils_validators_code() -> str:
@@ -18,22 +19,18 @@ def generate_core_utils_validators_code() -> str:
     return generate_file_content("core_validators_template.py.jinja2")
 
 
-def configure_core_utils_validators_in_project(base_path: Path):
+def configure_core_utils_validators_in_project(plan: ProjectPlan):
     """
     Configure core validators in the project.
 
-    This function generates the core validators code and writes it to a file
-    in the project directory.
+    This function generates the core validators code and adds it to a file
+    of the project plan.
 
     Args:
-        base_path (Path): The base path of the project directory.
+        plan (ProjectPlan): The plan of the project.
     """
-    core_utils_validators_path = base_path / "app" / "core" / "utils" / "validators.py"
-    print(
-        f"[yellow]Configuring core validators in {core_utils_validators_path}...[/yellow]"
-    )
-    write_file(
+    core_utils_validators_path = Path("app") / "core" / "utils" / "validators.py"
+    plan.add_file(
         core_utils_validators_path,
         generate_core_utils_validators_code(),
     )
-    print("[green]Core validators configured successfully![/green]")
@@ -1,16 +1,17 @@
 import os
 from pathlib import Path
+from typing import Any
 from rich import print
 from rich.prompt import Prompt
 import subprocess
 
-from fastapi_create.constants import DB_URL_REGEX
+from fastapi_create.constants import DB_ENGINES, DB_URL_REGEX
+from fastapi_create.project_setup import ProjectPlan
 import typer
 from fastapi_create.utils import (
     generate_file_content,
+    get_answer,
     recursive_prompt_with_validation,
-    write_file,
-    add_key_value_to_env_file,
 )
 
 
@@ -28,6 +29,9 @@ def validate_sqlite_url(value: str) -> bool:
     Returns:
         bool: True if the URL is valid, False otherwise.
     """
+    if not isinstance(value, str):
+        print("[red]Error: The SQLite database path must be a string[/red]")
+        return False
     if value == ":memory:":
         return True
     path = Path(value)
@@ -63,7 +67,7 @@ def validate_db_url(value: str, engine: str) -> bool:
     is within the valid range (1-65535). If the URL is malformed or does not meet the
     criteria, an error message is printed and the function returns False.
     """
-    if not DB_URL_REGEX.match(value):
+    if not isinstance(value, str) or not DB_URL_REGEX.match(value):
         print(
             f"[red]Error: Invalid format for {engine}. Expected: user:password@host[:port]/dbname[/red]"
         )
@@ -86,27 +90,40 @@ def validate_db_url(value: str, engine: str) -> bool:
         return False
 
 
-def configure_database(is_async: bool) -> tuple[str | None, str]:
+def configure_database(
+    is_async: bool, answers: dict[str, Any] | None = None, assume_yes: bool = False
+) -> tuple[str | None, str]:
     """
     Configure the database connection details.
 
     Prompts the user to select the database engine (PostgreSQL, MySQL, SQLite, or MariaDB). Based on the
     user's choices, it determines the appropriate database dependency and constructs
-    the database URL.
+    the database URL. Questions answered in answers are not prompted for.
 
     Args:
         is_async (bool): A boolean indicating whether the database should be asynchronous
+        answers (dict[str, Any] | None): Answers provided upfront for the "database",
+                                         "database_path" and "database_url" keys. Defaults to None.
+        assume_yes (bool): Whether to use defaults instead of prompting. Defaults to False.
 
     Returns:
         tuple: A tuple containing:
             - db_dependency (str | None): The database dependency module name.
             - db_url (str): The constructed database connection URL.
     """
-    db_engine = Prompt.ask(
-        "Which database are you using?",
+    answers = answers or {}
+    db_engine = get_answer(
+        answers,
+        "database",
+        lambda: Prompt.ask(
+            "Which database are you using?",
+            default="sqlite",
+            choices=DB_ENGINES,
+            show_choices=True,
+        ),
+        assume_yes,
         default="sqlite",
-        choices=["postgresql", "mysql", "sqlite", "mariadb"],
-        show_choices=True,
+        validation_func=lambda value: value in DB_ENGINES,
     )
     db_dependency = {
         "postgresql": "psycopg",
@@ -115,16 +132,29 @@ def configure_database(is_async: bool) -> tuple[str | None, str]:
         "sqlite": "aiosqlite" if is_async else None,
     }[db_engine]
     if db_engine.lower() == "sqlite":
-        db_url = recursive_prompt_with_validation(
-            prompt="Enter the path to the SQLite database file",
+        db_url = get_answer(
+            answers,
+            "database_path",
+            lambda: recursive_prompt_with_validation(
+                prompt="Enter the path to the SQLite database file",
+                validation_func=validate_sqlite_url,
+            ),
+            assume_yes,
+            default="app.db",
             validation_func=validate_sqlite_url,
         )
         db_url = f"sqlite{'+aiosqlite' if is_async else ''}:///{db_url}"
     else:
-        db_url = recursive_prompt_with_validation(
-            prompt="Enter the database connection details (e.g., user:password@host:port/dbname)",
-            validation_func=validate_db_url,
-            validation_args=(db_engine,),
+        db_url = get_answer(
+            answers,
+            "database_url",
+            lambda: recursive_prompt_with_validation(
+                prompt="Enter the database connection details (e.g., user:password@host:port/dbname)",
+                validation_func=validate_db_url,
+                validation_args=(db_engine,),
+            ),
+            assume_yes,
+            validation_func=lambda value: validate_db_url(value, db_engine),
         )
         prefix = {
             "postgresql": "postgresql+psycopg",
@@ -135,53 +165,71 @@ def configure_database(is_async: bool) -> tuple[str | None, str]:
     return db_dependency, db_url
 
 
-def configure_database_connection(db_url: str, base_path: Path) -> None:
+def configure_database_connection(db_url: str, plan: ProjectPlan) -> None:
     """
-    Write database connection details to a .env file.
-
-    This function takes a database URL and a base path, and writes the database
-    connection details to a .env file located at the specified base path.
+    Add database connection details to the .env file of the project plan.
 
     Args:
         db_url (str): The database connection URL.
-        base_path (Path): The base path where the .env file is located.
+        plan (ProjectPlan): The plan of the project.
 
     Returns:
         None
     """
-    add_key_value_to_env_file(base_path / ".env", "DATABASE_URL", db_url)
+    plan.set_env("DATABASE_URL", db_url)
 
 
-def configure_database_in_project(is_async: bool, base_path: Path) -> None:
+def configure_database_in_project(
+    is_async: bool,
+    plan: ProjectPlan,
+    read_replicas_enabled: bool = False,
+    alembic_include: bool = False,
+    cached_model: str | None = None,
+) -> None:
     """
     Configure database-related files in the project.
 
-    This function sets up the necessary database configuration files in the specified project directory.
+    This function adds the necessary database configuration files to the project plan.
     It uses Jinja2 templates to generate the content of these files based on the provided database thread type.
 
     Args:
         is_async (bool): A boolean indicating whether the database should be asynchronous.
-        base_path (Path): The base path of the project where the database configuration files will be created.
+        plan (ProjectPlan): The plan of the project the database configuration files are added to.
+        read_replicas_enabled (bool): Whether read-only queries can be routed to read replicas.
+                                      Defaults to False.
+        alembic_include (bool): Whether the project uses Alembic migrations, so the database
+                                revision can be checked on startup. Defaults to False.
+        cached_model (str | None): The model cached by app.core.cache, whose rows updated by
+                                   repository upserts are removed from the cache on commit.
+                                   Defaults to None.
 
     Returns:
         None
     """
-    db_path = base_path / "app" / "db"
+    db_path = Path("app") / "db"
     configs: list[tuple[str, str, dict]] = [
         (
             "db_config_template.py.jinja2",
             "config.py",
-            {"is_async": is_async},
+            {"is_async": is_async, "read_replicas_enabled": read_replicas_enabled},
         ),
         (
             "init_db_template.py.jinja2",
             "init_db.py",
-            {"is_async": is_async},
+            {
+                "is_async": is_async,
+                "alembic_include": alembic_include,
+                "read_replicas_enabled": read_replicas_enabled,
+            },
+        ),
+        ("db_mixins_template.py.jinja2", "mixins.py", {"is_async": is_async}),
+        (
+            "db_repository_template.py.jinja2",
+            "repository.py",
+            {"is_async": is_async, "cached_model": cached_model},
         ),
         ("models_template.py.jinja2", "models.py", {}),
     ]
     for template_name, filename, kwargs in configs:
-        print(f"[yellow]Writing {filename} to the project...[/yellow]")
         content = generate_file_content(template_name, **kwargs)
-        write_file(db_path / filename, content)
-        print(f"[green]{filename} written successfully[/green]")
+        plan.add_file(db_path / filename, content)
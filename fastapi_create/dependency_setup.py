@@ -1,27 +1,31 @@
 from pathlib import Path
 import subprocess
+import sys
+import tempfile
+import time
 import typer
 from rich import print
-from fastapi_create.constants import DEPENDENCIES
+from fastapi_create.constants import DB_DEPENDENCIES, DEPENDENCIES, Installer
 from fastapi_create.requirements_setup import generate_requirements_txt
+from fastapi_create.utils import get_uv_executable, get_wheelhouse_args
+from fastapi_create.venv_setup import create_project_venv
 
 
-def install_dependencies(
-    base_path: Path,
+def get_dependencies(
     is_async: bool,
     db_dependency: str | None = None,
     auth_system: str | None = None,
-) -> None:
+) -> list[str]:
     """
-    Install project dependencies based on database thread type.
+    Build the full list of dependencies required by the project.
 
     Args:
-        base_path (Path): The base path where the requirements.txt file will be generated.
         is_async (bool): Whether the application is using asynchronous dependencies.
         db_dependency (str | None, optional): An additional database dependency to install. Defaults to None.
+        auth_system (str | None, optional): The authentication system being used. Defaults to None.
 
-    Raises:
-        RuntimeError: If there is an error installing any of the dependencies.
+    Returns:
+        list[str]: The dependencies to install.
     """
     dependencies = DEPENDENCIES.copy()
     if is_async:
@@ -32,13 +36,155 @@ def install_dependencies(
         dependencies.append(db_dependency)
     if auth_system:
         if auth_system == "jwt":
-            dependencies.append("pyjwt")
-    print("[yellow]Installing project dependencies...[/yellow]")
-    for dependency in dependencies:
-        try:
-            subprocess.run(["pip", "install", dependency], check=True)
-        except subprocess.CalledProcessError:
-            print(f"[red]Error installing {dependency}[/red]", file="stderr")
-            raise RuntimeError(f"Error installing {dependency}")
-    print("[green]Dependencies installed successfully[/green]")
-    generate_requirements_txt(base_path)
+            # The crypto extra provides the RS256 and EdDSA algorithms
+            dependencies.append("pyjwt[crypto]")
+    return dependencies
+
+
+def get_all_dependencies() -> list[str]:
+    """
+    Build the list of dependencies required by any supported project configuration.
+
+    Returns:
+        list[str]: The union of the dependencies of every configuration.
+    """
+    dependencies: list[str] = []
+    for is_async in (True, False):
+        for db_dependency in DB_DEPENDENCIES:
+            for dependency in get_dependencies(is_async, db_dependency, "jwt"):
+                if dependency not in dependencies:
+                    dependencies.append(dependency)
+    return dependencies
+
+
+def get_install_command(
+    installer: Installer = Installer.auto, python: Path | str = sys.executable
+) -> list[str]:
+    """
+    Get the command used to install packages into a Python interpreter.
+
+    Args:
+        installer (Installer): The installer backend to use. Defaults to Installer.auto.
+        python (Path | str): The interpreter to install packages into.
+                             Defaults to the interpreter running the CLI.
+
+    Returns:
+        list[str]: The install command, without the packages to install.
+
+    Raises:
+        RuntimeError: If uv is requested but is not installed.
+    """
+    uv_path = get_uv_executable(installer)
+    if uv_path:
+        return [uv_path, "pip", "install", "--python", str(python)]
+    return [str(python), "-m", "pip", "install"]
+
+
+def install_packages(
+    requirements_path: Path,
+    python: Path | str = sys.executable,
+    installer: Installer = Installer.auto,
+    wheelhouse: Path | None = None,
+) -> None:
+    """
+    Install the packages pinned in a requirements file in a single installer call.
+
+    Args:
+        requirements_path (Path): The requirements file listing the packages to install.
+        python (Path | str, optional): The interpreter to install packages into.
+                                       Defaults to the interpreter running the CLI.
+        installer (Installer, optional): The installer backend to use. Defaults to Installer.auto.
+        wheelhouse (Path | None, optional): A local wheel directory to install from without
+                                            network access. Defaults to None.
+
+    Raises:
+        RuntimeError: If there is an error installing the packages.
+    """
+    command = get_install_command(installer, python)
+    if wheelhouse:
+        command.extend(get_wheelhouse_args(wheelhouse))
+    source = f" from {wheelhouse}" if wheelhouse else ""
+    print(f"[yellow]Installing project dependencies{source}...[/yellow]")
+    try:
+        subprocess.run([*command, "-r", str(requirements_path)], check=True)
+    except subprocess.CalledProcessError:
+        print("[red]Error installing dependencies[/red]", file=sys.stderr)
+        raise RuntimeError("Error installing dependencies")
+
+
+def resolve_dependencies(
+    is_async: bool,
+    db_dependency: str | None = None,
+    auth_system: str | None = None,
+    installer: Installer = Installer.auto,
+    wheelhouse: Path | None = None,
+) -> str:
+    """
+    Resolve project dependencies based on database thread type into a pinned lockfile.
+
+    Resolution does not depend on the project files, so it can run while the
+    project is still being rendered.
+
+    Args:
+        is_async (bool): Whether the application is using asynchronous dependencies.
+        db_dependency (str | None, optional): An additional database dependency to install. Defaults to None.
+        auth_system (str | None, optional): The authentication system being used. Defaults to None.
+        installer (Installer, optional): The installer backend to use. Defaults to Installer.auto.
+        wheelhouse (Path | None, optional): A local wheel directory to resolve against without
+                                            network access. Defaults to None.
+
+    Returns:
+        str: The content of the requirements.txt lockfile.
+
+    Raises:
+        RuntimeError: If there is an error resolving the dependencies.
+    """
+    dependencies = get_dependencies(is_async, db_dependency, auth_system)
+    start = time.perf_counter()
+    requirements = generate_requirements_txt(dependencies, installer, wheelhouse)
+    print(
+        f"[green]Dependencies resolved into requirements.txt in {time.perf_counter() - start:.2f}s[/green]"
+    )
+    return requirements
+
+
+def install_dependencies(
+    requirements: str,
+    installer: Installer = Installer.auto,
+    wheelhouse: Path | None = None,
+    venv_base_path: Path | None = None,
+) -> None:
+    """
+    Install the packages pinned in a requirements.txt lockfile in a single installer call.
+
+    By default they are installed into the interpreter running the CLI, which
+    does not depend on the project files. With venv_base_path they are made
+    available in an isolated virtual environment inside that project instead.
+
+    Args:
+        requirements (str): The content of the requirements.txt lockfile, as returned
+                            by resolve_dependencies.
+        installer (Installer, optional): The installer backend to use. Defaults to Installer.auto.
+        wheelhouse (Path | None, optional): A local wheel directory to install from without
+                                            network access. Defaults to None.
+        venv_base_path (Path | None, optional): The base path of a project to install into a
+                                                virtual environment of. Defaults to None.
+
+    Raises:
+        RuntimeError: If there is an error installing the dependencies.
+    """
+    start = time.perf_counter()
+    with tempfile.TemporaryDirectory() as temp_dir:
+        requirements_path = Path(temp_dir) / "requirements.txt"
+        requirements_path.write_text(requirements)
+
+        def install(python: Path | str) -> None:
+            install_packages(requirements_path, python, installer, wheelhouse)
+
+        if venv_base_path:
+            create_project_venv(venv_base_path, requirements.splitlines(), install)
+        else:
+            install(sys.executable)
+    print(
+        f"[green]Dependencies installed successfully in {time.perf_counter() - start:.2f}s[/green]"
+    )
@@ -0,0 +1,52 @@
+from pathlib import Path
+from rich import print
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content
+
+
+def generate_health_router_code(is_async: bool, smtp_enabled: bool) -> str:
+    """
+    Generate health router code from a template.
+
+    This function prints a message indicating that the health router code
+    is being generated, and then it generates the content of the health
+    router file using a Jinja2 template.
+
+    Args:
+        is_async (bool): Whether the application is using asynchronous dependencies.
+                         If True, the database probe uses the async engine.
+        smtp_enabled (bool): Whether the application is using SMTP for sending emails.
+                             If True, the SMTP host is probed as well.
+
+    Returns:
+        str: The generated health router code as a string.
+    """
+    print("[yellow]Generating health router code...[/yellow]")
+    return generate_file_content(
+        "health_router_template.py.jinja2",
+        is_async=is_async,
+        smtp_enabled=smtp_enabled,
+    )
+
+
+def configure_health_router_in_project(
+    plan: ProjectPlan, is_async: bool, smtp_enabled: bool
+) -> None:
+    """
+    Add the health router to the project plan.
+
+    This function generates the health router code and adds it to the
+    appropriate file of the project plan.
+
+    Args:
+        plan (ProjectPlan): The plan of the project the health router file is added to.
+        is_async (bool): Whether the application is using asynchronous dependencies.
+                         If True, the database probe uses the async engine.
+        smtp_enabled (bool): Whether the application is using SMTP for sending emails.
+                             If True, the SMTP host is probed as well.
+
+    Returns:
+        None
+    """
+    router_path = Path("app") / "routes" / "health.py"
+    plan.add_file(router_path, generate_health_router_code(is_async, smtp_enabled))
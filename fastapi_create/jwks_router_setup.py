@@ -0,0 +1,36 @@
+from pathlib import Path
+from rich import print
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content
+
+
+def generate_jwks_router_code() -> str:
+    """
+    Generate JWKS router code from a template.
+
+    This function prints a message indicating that the JWKS router code is
+    being generated, and then it generates the content of the JWKS router
+    file using a Jinja2 template.
+
+    Returns:
+        str: The generated JWKS router code as a string.
+    """
+    print("[yellow]Generating JWKS router code...[/yellow]")
+    return generate_file_content("jwks_router_template.py.jinja2")
+
+
+def configure_jwks_router_in_project(plan: ProjectPlan) -> None:
+    """
+    Add the JWKS router to the project plan.
+
+    This function generates the JWKS router code and adds it to the
+    appropriate file of the project plan.
+
+    Args:
+        plan (ProjectPlan): The plan of the project the JWKS router file is added to.
+
+    Returns:
+        None
+    """
+    router_path = Path("app") / "routes" / "jwks.py"
+    plan.add_file(router_path, generate_jwks_router_code())
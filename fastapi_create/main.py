@@ -1,9 +1,17 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from multiprocessing import Manager
+import os
 from pathlib import Path
-from typing import Any
+import tempfile
+from typing import Any, ContextManager
 import typer
 from rich import print
-from rich.prompt import Prompt, Confirm
-from fastapi_create.auth_setup import handle_auth_setup
+from fastapi_create.answers_setup import (
+    ProjectAnswers,
+    collect_answers,
+    load_answers_file,
+)
 from fastapi_create.core_dependencies_setup import (
     configure_core_dependencies_in_project,
 )
@@ -11,24 +19,36 @@ from fastapi_create.manage_setup import configure_manage_in_project
 from fastapi_create.readme_setup import configure_readme_in_project
 from fastapi_create.smtp_setup import (
     configure_core_messages_in_project,
-    configure_smtp_settings,
+    write_smtp_settings,
 )
 from fastapi_create.utils import (
     clean_up,
     project_name_callback,
+    uninstall_dependencies,
     generate_base_path,
+    validate_project_directory,
+    validate_project_name,
 )
 from fastapi_create.database_setup import (
-    configure_database,
     configure_database_connection,
     configure_database_in_project,
 )
-from fastapi_create.alembic_setup import alembic_folder_name_prompt, alembic_setup
-from fastapi_create.project_setup import spin_up_project
-from fastapi_create.dependency_setup import install_dependencies
+from fastapi_create.alembic_setup import alembic_setup
+from fastapi_create.pipeline import (
+    PipelineError,
+    Step,
+    print_timings_report,
+    run_steps,
+)
+from fastapi_create.project_setup import ProjectPlan, spin_up_project
+from fastapi_create.constants import Installer
+from fastapi_create.dependency_setup import install_dependencies, resolve_dependencies
 from fastapi_create.config_setup import configure_core_config_in_project
 from fastapi_create.main_setup import configure_main_in_project
 from fastapi_create.auth_router_setup import configure_auth_router_in_project
+from fastapi_create.health_router_setup import configure_health_router_in_project
+from fastapi_create.jwks_router_setup import configure_jwks_router_in_project
+from fastapi_create.core_cache_setup import configure_core_cache_in_project
 from fastapi_create.auth_schema_setup import configure_auth_schema_in_project
 from fastapi_create.core_utils_security_setup import (
     configure_core_utils_security_in_project,
@@ -37,185 +57,525 @@ from fastapi_create.core_utils_validators_setup import (
     configure_core_utils_validators_in_project,
 )
 from fastapi_create.auth_db_models_setup import configure_db_models_in_project
+from fastapi_create.wheelhouse_setup import (
+    DEFAULT_WHEELHOUSE,
+    build_wheelhouse,
+    validate_wheelhouse,
+)
 
 app = typer.Typer(no_args_is_help=True)
+wheelhouse_app = typer.Typer(
+    no_args_is_help=True, help="Manage the local wheelhouse used by offline mode."
+)
+app.add_typer(wheelhouse_app, name="wheelhouse")
 
+INSTALLER_OPTION = typer.Option(
+    Installer.auto,
+    help="Backend used to install dependencies. 'auto' uses uv when it is available, otherwise pip.",
+)
+WHEELHOUSE_OPTION = typer.Option(
+    None,
+    help="Install dependencies from this local wheel directory without network access.",
+)
+OFFLINE_OPTION = typer.Option(
+    False,
+    "--offline",
+    help=f"Install dependencies from the default wheelhouse ({DEFAULT_WHEELHOUSE}) without network access.",
+)
+VENV_OPTION = typer.Option(
+    False,
+    "--venv",
+    help="Install dependencies into a virtual environment inside the project instead of the current interpreter.",
+)
 
-@app.command()
-def create(project_name: str = typer.Argument("", callback=project_name_callback)):
-    """Create a new FastAPI project."""
-    base_path: Path = generate_base_path(project_name)
 
-    # Prevent overwriting existing directory unless it's empty
-    if base_path.exists():
-        if base_path.is_dir() and any(base_path.iterdir()):
-            print(
-                f"[red]Error: Directory '{base_path}' already exists and is not empty. Aborting.[/red]"
-            )
-            raise typer.Exit(1)
-        elif base_path.is_file():
-            print(
-                f"[red]Error: '{base_path}' is a file, not a directory. Aborting.[/red]"
-            )
-            raise typer.Exit(1)
+def resolve_wheelhouse(wheelhouse: Path | None, offline: bool) -> Path | None:
+    """
+    Resolve the wheelhouse to install from and make sure it is usable.
 
-    try:
-        # PROMPT USER FOR CONFIGURATION
-        ## Prompt user for thread type
-        thread_type = Prompt.ask(
-            "Do you want your FastAPI application to be synchronous or asynchronous?",
-            choices=["async", "sync"],
-            default="async",
-        )
-        is_async = thread_type == "async"
+    Args:
+        wheelhouse (Path | None): The wheelhouse passed with --wheelhouse.
+        offline (bool): Whether --offline was passed.
 
-        ## Prompt user for database configuration
-        db_dependency, db_url = configure_database(is_async)
+    Returns:
+        Path | None: The wheelhouse to install from, or None to install from the index.
 
-        ## Prompt user for SMTP configuration
-        smtp_enabled = configure_smtp_settings(base_path)
+    Raises:
+        typer.Exit: If the wheelhouse is missing or empty.
+    """
+    if offline and wheelhouse is None:
+        wheelhouse = DEFAULT_WHEELHOUSE
+    if wheelhouse and not validate_wheelhouse(wheelhouse):
+        raise typer.Exit(1)
+    return wheelhouse
 
-        ## Prompt user for Auth configuration
-        auth_enabled = Confirm.ask(
-            "Do you want to include authentication and authorization?", default=True
-        )
-        if auth_enabled:
-            auth_system = Prompt.ask(
-                "Which authentication system do you want to use?",
-                choices=["JWT", "Session"],
-                default="JWT",
-                case_sensitive=False,
-            ).lower()
-            auth_model, required_fields, login_field = handle_auth_setup()
-            username_is_required = "username" in required_fields
-            email_is_required = "email" in required_fields
-            phone_is_required = "phone" in required_fields
-            verification_enabled = (
-                Confirm.ask(
-                    "Do you want to include email verification for user registration?",
-                    default=True,
-                )
-                if smtp_enabled
-                else False
+
+def get_create_steps(
+    project_name: str,
+    answers: ProjectAnswers,
+    installer: Installer = Installer.auto,
+    wheelhouse: Path | None = None,
+    use_venv: bool = False,
+    install_lock: ContextManager[Any] | None = None,
+) -> list[Step]:
+    """
+    Get the steps that create a FastAPI project from collected answers.
+
+    Every file is rendered into an in-memory plan, and the plan is written to
+    disk in one pass once rendering is complete. A failure while rendering
+    therefore leaves nothing behind to clean up. Dependency resolution,
+    Alembic initialization and each rendered file are independent steps, and
+    dependencies are installed into the current interpreter as soon as they
+    are resolved. With use_venv, they are installed once the project exists.
+
+    The arguments are the same as create_project.
+
+    Returns:
+        list[Step]: The steps of the create pipeline.
+    """
+
+    def plan_project() -> ProjectPlan:
+        # Plan project skeleton
+        plan = spin_up_project(project_name)
+        if answers.smtp_enabled:
+            write_smtp_settings(plan, answers.smtp_settings)
+        # Configure database connection
+        configure_database_connection(answers.db_url, plan)
+        return plan
+
+    def write_project(plan: ProjectPlan, resolve: str, **_: Any) -> Path:
+        plan.add_file("requirements.txt", resolve)
+        return plan.write()
+
+    def install(resolve: str, write: Path | None = None) -> None:
+        with install_lock or nullcontext():
+            install_dependencies(resolve, installer, wheelhouse, write)
+
+    steps = [
+        Step("plan", plan_project),
+        Step(
+            "resolve",
+            lambda: resolve_dependencies(
+                answers.is_async,
+                answers.db_dependency,
+                answers.auth_system,
+                installer,
+                wheelhouse,
+            ),
+        ),
+        Step(
+            "database",
+            lambda plan: configure_database_in_project(
+                answers.is_async,
+                plan,
+                answers.read_replicas_enabled,
+                answers.alembic_include,
+                answers.auth_model,
+            ),
+            ("plan",),
+        ),  # Configure database in project
+        Step(
+            "core_config",
+            lambda plan: configure_core_config_in_project(
+                plan,
+                answers.auth_system,
+                answers.cors_enabled,
+                answers.smtp_enabled,
+                answers.verification_enabled,
+                answers.read_replicas_enabled,
+                answers.stateless_jwt_enabled,
+                answers.alembic_include,
+                answers.is_async,
+            ),
+            ("plan",),
+        ),  # Configure core config
+        Step(
+            "core_dependencies",
+            lambda plan: configure_core_dependencies_in_project(
+                plan,
+                answers.is_async,
+                answers.auth_model,
+                answers.auth_system,
+                answers.auth_enabled,
+                answers.smtp_enabled,
+                answers.verification_enabled,
+                answers.read_replicas_enabled,
+                answers.stateless_jwt_enabled,
+            ),
+            ("plan",),
+        ),  # Configure core dependencies
+        Step(
+            "main",
+            lambda plan: configure_main_in_project(
+                answers.is_async,
+                plan,
+                answers.cors_enabled,
+                answers.auth_enabled,
+                answers.auth_system,
+            ),
+            ("plan",),
+        ),  # Configure main
+        Step(
+            "health_router",
+            lambda plan: configure_health_router_in_project(
+                plan, answers.is_async, answers.smtp_enabled
+            ),
+            ("plan",),
+        ),  # Configure health router
+        Step(
+            "manage",
+            lambda plan: configure_manage_in_project(
+                plan, answers.is_async, answers.alembic_include, answers.auth_system
+            ),
+            ("plan",),
+        ),  # Configure manage.py
+        Step(
+            "readme", lambda plan: configure_readme_in_project(plan), ("plan",)
+        ),  # Configure README
+    ]
+    if answers.smtp_enabled:
+        steps.append(
+            Step(
+                "core_messages",
+                lambda plan: configure_core_messages_in_project(plan, answers.is_async),
+                ("plan",),
             )
-        else:
-            (
-                auth_system,
-                auth_model,
-                required_fields,
-                login_field,
-                verification_enabled,
-                username_is_required,
-                email_is_required,
-                phone_is_required,
-            ) = (
-                None,
-                None,
-                None,
-                None,
-                False,
-                False,
-                False,
-                False,
+        )  # Configure core messages
+    if answers.alembic_include:
+        steps.append(
+            Step(
+                "alembic",
+                lambda plan: alembic_setup(
+                    answers.alembic_folder_name, plan, answers.is_async
+                ),
+                ("plan",),
             )
-
-        ## Prompt user for alembic configuration
-        alembic_include = Confirm.ask(
-            "Do you want to include Alembic migrations?",
-            default=True,
+        )  # Configure Alembic if enabled
+    if answers.auth_enabled:
+        # Configure authentication if enabled
+        steps.extend(
+            [
+                Step(
+                    "core_utils_security",
+                    lambda plan: configure_core_utils_security_in_project(
+                        plan,
+                        answers.verification_enabled,
+                        answers.auth_system,
+                        answers.stateless_jwt_enabled,
+                        answers.is_async,
+                    ),
+                    ("plan",),
+                ),  # Configure core utils security
+                Step(
+                    "core_utils_validators",
+                    lambda plan: configure_core_utils_validators_in_project(plan),
+                    ("plan",),
+                ),  # Configure core utils validators
+                Step(
+                    "core_cache",
+                    lambda plan: configure_core_cache_in_project(
+                        plan, answers.is_async, answers.auth_model
+                    ),
+                    ("plan",),
+                ),  # Configure core cache
+                Step(
+                    "db_models",
+                    lambda plan, database: configure_db_models_in_project(
+                        plan,
+                        answers.auth_model,
+                        answers.login_field,
+                        answers.is_async,
+                        answers.email_is_required,
+                        answers.phone_is_required,
+                        answers.username_is_required,
+                        answers.verification_enabled,
+                        answers.stateless_jwt_enabled,
+                    ),
+                    # Replaces the models.py added by the database step
+                    ("plan", "database"),
+                ),  # Configure db models
+                Step(
+                    "auth_router",
+                    lambda plan: configure_auth_router_in_project(
+                        plan,
+                        answers.auth_model,
+                        answers.auth_system,
+                        answers.login_field,
+                        answers.email_is_required,
+                        answers.phone_is_required,
+                        answers.username_is_required,
+                        answers.is_async,
+                        answers.verification_enabled,
+                        answers.read_replicas_enabled,
+                        answers.stateless_jwt_enabled,
+                    ),
+                    ("plan",),
+                ),  # Configure auth router
+                Step(
+                    "auth_schema",
+                    lambda plan: configure_auth_schema_in_project(
+                        plan,
+                        answers.auth_model,
+                        answers.auth_system,
+                        answers.login_field,
+                        answers.email_is_required,
+                        answers.phone_is_required,
+                        answers.username_is_required,
+                        answers.verification_enabled,
+                        answers.stateless_jwt_enabled,
+                    ),
+                    ("plan",),
+                ),  # Configure auth schema
+            ]
         )
+        if answers.auth_system == "jwt":
+            steps.append(
+                Step(
+                    "jwks_router",
+                    lambda plan: configure_jwks_router_in_project(plan),
+                    ("plan",),
+                )
+            )  # Configure JWKS router
+
+    # Write the whole project in one pass once every file is rendered
+    rendered = tuple(step.name for step in steps if "plan" in step.requires)
+    steps.append(Step("write", write_project, ("plan", "resolve", *rendered)))
+    steps.append(
+        Step("install", install, ("resolve", "write") if use_venv else ("resolve",))
+    )
+    return steps
+
+
+def create_project(
+    project_name: str,
+    answers: ProjectAnswers,
+    installer: Installer = Installer.auto,
+    wheelhouse: Path | None = None,
+    use_venv: bool = False,
+    install_lock: ContextManager[Any] | None = None,
+    timings: bool = False,
+) -> Path:
+    """
+    Create a FastAPI project from collected answers.
 
-        ## Prompt user for alembic folder name
-        alembic_folder_name = alembic_folder_name_prompt() if alembic_include else None
+    The steps returned by get_create_steps are run concurrently wherever they
+    do not depend on each other.
 
-        ## Prompt user for CORS configuration
-        cors_enabled = Confirm.ask(
-            "Do you want to include CORS middleware?",
-            default=True,
+    Args:
+        project_name (str): The name of the project directory to create.
+                            If the value is ".", the current directory will be used.
+        answers (ProjectAnswers): The answers to the configuration questions.
+        installer (Installer, optional): The installer backend to use. Defaults to Installer.auto.
+        wheelhouse (Path | None, optional): A local wheel directory to install from without
+                                            network access. Defaults to None.
+        use_venv (bool, optional): Whether to install into a virtual environment inside the
+                                   project. Defaults to False.
+        install_lock (ContextManager[Any] | None, optional): A lock held while installing
+                                                             dependencies, used to serialise
+                                                             installs into a shared interpreter.
+                                                             Dependencies are never uninstalled
+                                                             on failure when it is given, as
+                                                             other projects sharing the
+                                                             interpreter may need them.
+                                                             Defaults to None.
+        timings (bool, optional): Whether to print the time taken by each step and the
+                                  critical path. Defaults to False.
+
+    Returns:
+        Path: The path to the created project.
+
+    Raises:
+        PipelineError: If a step fails.
+    """
+    steps = get_create_steps(
+        project_name, answers, installer, wheelhouse, use_venv, install_lock
+    )
+    try:
+        results, step_timings = run_steps(steps)
+    except PipelineError as e:
+        installed = "install" in e.results or e.step == "install"
+        shared = install_lock is not None
+        if installed and not use_venv and not shared and "write" not in e.results:
+            # The project was never written, so clean_up cannot find the
+            # requirements.txt of the dependencies installed into the interpreter
+            with tempfile.TemporaryDirectory() as temp_dir:
+                (Path(temp_dir) / "requirements.txt").write_text(e.results["resolve"])
+                uninstall_dependencies(Path(temp_dir))
+        raise
+    if timings:
+        print_timings_report(steps, step_timings)
+    return results["write"]
+
+
+def create_project_or_clean_up(
+    project_name: str,
+    answers: ProjectAnswers,
+    installer: Installer = Installer.auto,
+    wheelhouse: Path | None = None,
+    use_venv: bool = False,
+    install_lock: ContextManager[Any] | None = None,
+) -> str | None:
+    """
+    Create a FastAPI project, removing it again if creation fails.
+
+    This is the unit of work run by create-many in each worker process. It takes
+    the same arguments as create_project. Without use_venv, every project of the
+    batch installs into the same interpreter, so the dependencies of a failed
+    project are left installed for the other projects.
+
+    Returns:
+        str | None: The error that made creation fail, or None on success.
+    """
+    try:
+        create_project(
+            project_name, answers, installer, wheelhouse, use_venv, install_lock
         )
+    except Exception as e:
+        print(f"[red]Error creating '{project_name}': {e}[/red]")
+        shared = not use_venv and install_lock is not None
+        if shared:
+            print(
+                f"[yellow]Leaving the dependencies of '{project_name}' installed, "
+                "other projects of the batch share the interpreter[/yellow]"
+            )
+        clean_up(generate_base_path(project_name), uninstall=not use_venv and not shared)
+        return str(e)
+    return None
+
 
-        # Create project skeleton
-        spin_up_project(project_name)
+@app.command()
+def create(
+    project_name: str = typer.Argument("", callback=project_name_callback),
+    config: Path | None = typer.Option(
+        None,
+        help="TOML file with answers to the configuration questions. Answered questions are not prompted for.",
+    ),
+    yes: bool = typer.Option(
+        False,
+        "--yes",
+        "-y",
+        help="Use the default for every question not answered in --config instead of prompting.",
+    ),
+    installer: Installer = INSTALLER_OPTION,
+    wheelhouse: Path | None = WHEELHOUSE_OPTION,
+    offline: bool = OFFLINE_OPTION,
+    venv: bool = VENV_OPTION,
+    timings: bool = typer.Option(
+        False,
+        "--timings",
+        help="Print the time taken by each step and the critical path.",
+    ),
+):
+    """Create a new FastAPI project."""
+    wheelhouse = resolve_wheelhouse(wheelhouse, offline)
+    base_path: Path = generate_base_path(project_name)
 
-        # Install dependencies
-        install_dependencies(base_path, is_async, db_dependency, auth_system)
+    # Prevent overwriting existing directory unless it's empty
+    if not validate_project_directory(base_path):
+        raise typer.Exit(1)
 
-        # Configure database connection
-        configure_database_connection(db_url, base_path)
-
-        # Configure database in project
-        configure_database_in_project(is_async, base_path)
-        if smtp_enabled:
-            configure_core_messages_in_project(
-                base_path, is_async
-            )  # Configure core messages
-        configure_core_config_in_project(
-            base_path, auth_system, cors_enabled, smtp_enabled, verification_enabled
-        )  # Configure core config
-        configure_core_dependencies_in_project(
-            base_path,
-            is_async,
-            auth_model,
-            auth_system,
-            auth_enabled,
-            smtp_enabled,
-            verification_enabled,
-        )  # Configure core dependencies
-        if alembic_include:
-            # Configure Alembic if enabled
-            alembic_setup(alembic_folder_name, base_path, is_async)
-        configure_main_in_project(
-            is_async, base_path, cors_enabled, auth_enabled
-        )  # Configure main
-        configure_manage_in_project(base_path)  # Configure manage.py
-        configure_readme_in_project(base_path)  # Configure README
-        if auth_enabled:
-            # Configure authentication if enabled
-            # configure_auth_in_project(base_path, is_async, auth_system, verification_enabled)
-            configure_core_utils_security_in_project(
-                base_path, verification_enabled, auth_system
-            )  # Configure core utils security
-            configure_core_utils_validators_in_project(
-                base_path,
-            )  # Configure core utils validators
-            configure_db_models_in_project(
-                base_path,
-                auth_model,
-                login_field,
-                is_async,
-                email_is_required,
-                phone_is_required,
-                username_is_required,
-                verification_enabled,
-            )  # Configure db models
-            configure_auth_router_in_project(
-                base_path,
-                auth_model,
-                auth_system,
-                login_field,
-                email_is_required,
-                phone_is_required,
-                username_is_required,
-                is_async,
-                verification_enabled,
-            )  # Configure auth router
-            configure_auth_schema_in_project(
-                base_path,
-                auth_model,
-                auth_system,
-                login_field,
-                email_is_required,
-                phone_is_required,
-                username_is_required,
-                verification_enabled,
-            )  # Configure auth schema
+    try:
+        # PROMPT USER FOR CONFIGURATION
+        answers = collect_answers(load_answers_file(config) if config else None, yes)
+        create_project(
+            project_name, answers, installer, wheelhouse, venv, timings=timings
+        )
     except KeyboardInterrupt:
         print("[yellow]Input interrupted by user.[/yellow]")
-        clean_up(base_path)
+        clean_up(base_path, uninstall=not venv)
         typer.Exit()
     except (Exception, SystemExit) as e:
         print(f"[red]Error: {e}[/red]")
-        clean_up(base_path)
+        clean_up(base_path, uninstall=not venv)
+        raise typer.Exit(code=1)
+
+
+@app.command("create-many")
+def create_many(
+    manifest: Path = typer.Argument(
+        ...,
+        help="TOML manifest with a [[projects]] table per project and optional shared [defaults].",
+    ),
+    jobs: int = typer.Option(
+        os.cpu_count() or 1, "--jobs", "-j", min=1, help="Number of worker processes."
+    ),
+    installer: Installer = INSTALLER_OPTION,
+    wheelhouse: Path | None = WHEELHOUSE_OPTION,
+    offline: bool = OFFLINE_OPTION,
+    venv: bool = VENV_OPTION,
+):
+    """
+    Create several FastAPI projects in parallel from a manifest.
+
+    Each [[projects]] entry needs a "name" and takes the same answers as
+    --config on create. Entries are merged over [defaults], and any question
+    left unanswered uses its default.
+    """
+    wheelhouse = resolve_wheelhouse(wheelhouse, offline)
+    try:
+        manifest_data = load_answers_file(manifest)
+        defaults = manifest_data.get("defaults", {})
+        projects: dict[str, ProjectAnswers] = {}
+        for entry in manifest_data.get("projects", []):
+            project_name = entry.get("name", "")
+            if not validate_project_name(project_name):
+                raise ValueError(f"Invalid project name {project_name!r}")
+            if project_name in projects or not validate_project_directory(
+                generate_base_path(project_name)
+            ):
+                raise ValueError(f"Cannot create project {project_name!r}")
+            projects[project_name] = collect_answers(
+                {**defaults, **entry}, assume_yes=True
+            )
+    except ValueError as e:
+        print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(code=1)
+
+    print(
+        f"[yellow]Creating {len(projects)} projects with {jobs} workers...[/yellow]"
+    )
+    with Manager() as manager:
+        # Installs into the shared interpreter must not run concurrently
+        install_lock = None if venv else manager.Lock()
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = {
+                executor.submit(
+                    create_project_or_clean_up,
+                    project_name,
+                    answers,
+                    installer,
+                    wheelhouse,
+                    venv,
+                    install_lock,
+                ): project_name
+                for project_name, answers in projects.items()
+            }
+            errors = {
+                futures[future]: future.result()
+                for future in as_completed(futures)
+                if future.result() is not None
+            }
+
+    for project_name, error in errors.items():
+        print(f"[red]Failed to create '{project_name}': {error}[/red]")
+    print(
+        f"[green]Created {len(projects) - len(errors)} of {len(projects)} projects[/green]"
+    )
+    if errors:
+        raise typer.Exit(code=1)
+
+
+@wheelhouse_app.command("build")
+def wheelhouse_build(
+    path: Path = typer.Argument(
+        DEFAULT_WHEELHOUSE, help="Directory where the wheels will be stored."
+    ),
+):
+    """Download and build wheels for every dependency a project may need."""
+    try:
+        build_wheelhouse(path)
+    except RuntimeError as e:
+        print(f"[red]Error: {e}[/red]")
         raise typer.Exit(code=1)
 
 
@@ -1,12 +1,14 @@
 from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content
 
 
 def generate_main_code(
     is_async: bool,
     cors_enabled: bool,
     auth_enabled: bool,
+    auth_system: str | None = None,
 ) -> str:
     """
     Generate the main application code from a template.
@@ -15,6 +17,8 @@ def generate_main_code(
         is_async (bool): Whether the application is using asynchronous dependencies.
         cors_enabled (bool): Whether CORS settings are enabled in the configuration.
                              If True, the configuration will include CORS settings.
+        auth_enabled (bool): Whether the authentication routes are included.
+        auth_system (str | None): The authentication system used in the project. Defaults to None.
 
     Returns:
         str: The generated main application code as a string.
@@ -25,27 +29,32 @@ def generate_main_code(
         is_async=is_async,
         cors_enabled=cors_enabled,
         auth_enabled=auth_enabled,
+        auth_system=auth_system,
     )
 
 
 def configure_main_in_project(
-    is_async: bool, base_path: Path, cors_enabled: bool, auth_enabled: bool
+    is_async: bool,
+    plan: ProjectPlan,
+    cors_enabled: bool,
+    auth_enabled: bool,
+    auth_system: str | None = None,
 ) -> None:
     """
     Configure main application files in the project.
 
     Args:
         is_async (bool): Whether the application is using asynchronous dependencies.
-        base_path (Path): The base path where the project is located.
+        plan (ProjectPlan): The plan of the project the main application file is added to.
         cors_enabled (bool): Whether CORS settings are enabled in the configuration.
                              If True, the configuration will include CORS settings.
                              Defaults to True.
+        auth_enabled (bool): Whether the authentication routes are included.
+        auth_system (str | None): The authentication system used in the project. Defaults to None.
 
     Returns:
         None
     """
-    app_path = base_path / "app"
-    print(f"[yellow]Writing main.py to the project...[/yellow]")
-    content = generate_main_code(is_async, cors_enabled, auth_enabled)
-    write_file(app_path / "main.py", content)
-    print("[green]main.py written successfully[/green]")
+    app_path = Path("app")
+    content = generate_main_code(is_async, cors_enabled, auth_enabled, auth_system)
+    plan.add_file(app_path / "main.py", content)
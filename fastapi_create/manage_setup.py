@@ -1,36 +1,58 @@
-from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content
 
 
-def generate_manage_code() -> str:
+def generate_manage_code(
+    is_async: bool, alembic_include: bool, auth_system: str | None = None
+) -> str:
     """
     Generate manage code from a template.
 
     This function prints a message indicating that the manage code is being generated,
     and then it generates the content of the manage code file using a Jinja2 template.
 
+    Args:
+        is_async (bool): Whether the project's database is asynchronous.
+        alembic_include (bool): Whether the project uses Alembic migrations.
+        auth_system (str | None): The authentication system used in the project.
+                                  If "jwt", a command rotating the signing keys is added.
+                                  Defaults to None.
+
     Returns:
         str: The generated manage code content.
     """
     print("[yellow]Generating manage code...[/yellow]")
-    return generate_file_content("manage_template.py.jinja2")
-
-
-def configure_manage_in_project(base_path: Path) -> None:
+    return generate_file_content(
+        "manage_template.py.jinja2",
+        is_async=is_async,
+        alembic_include=alembic_include,
+        auth_system=auth_system,
+    )
+
+
+def configure_manage_in_project(
+    plan: ProjectPlan,
+    is_async: bool = True,
+    alembic_include: bool = False,
+    auth_system: str | None = None,
+) -> None:
     """
-    Configure the manage.py file in the given project directory.
+    Configure the manage.py file in the given project plan.
 
-    This function generates the manage.py file content and writes it to the specified
-    base path directory. It prints status messages indicating the progress of the operation.
+    This function generates the manage.py file content and adds it to the root
+    of the project plan.
 
     Args:
-        base_path (Path): The base directory path where the manage.py file will be created.
+        plan (ProjectPlan): The plan of the project the manage.py file is added to.
+        is_async (bool): Whether the project's database is asynchronous. Defaults to True.
+        alembic_include (bool): Whether the project uses Alembic migrations. Defaults to False.
+        auth_system (str | None): The authentication system used in the project.
+                                  If "jwt", a command rotating the signing keys is added.
+                                  Defaults to None.
 
     Returns:
         None
     """
-    manage_path = base_path / "manage.py"
-    print("[yellow]Writing manage.py to the project...[/yellow]")
-    write_file(manage_path, generate_manage_code())
-    print("[green]manage.py written successfully[/green]")
+    plan.add_file("manage.py", generate_manage_code(is_async, alembic_include, auth_system)
+    )
@@ -0,0 +1,197 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+import time
+from typing import Any, Callable
+from rich import print
+from rich.table import Table
+
+
+@dataclass
+class Step:
+    """
+    A step of the create pipeline.
+
+    The output of a step is the value returned by func, published under the
+    step's name. A step runs as soon as every step it requires has finished,
+    and func receives the outputs of those steps as keyword arguments.
+
+    Attributes:
+        name (str): The name of the step, which is also the name of its output.
+        func (Callable[..., Any]): The function run by the step.
+        requires (tuple[str, ...]): The names of the steps whose outputs func takes.
+    """
+
+    name: str
+    func: Callable[..., Any]
+    requires: tuple[str, ...] = field(default_factory=tuple)
+
+
+class PipelineError(RuntimeError):
+    """
+    Raised when a step of the pipeline fails.
+
+    Attributes:
+        step (str): The name of the step that failed.
+        results (dict[str, Any]): The outputs of the steps that finished.
+    """
+
+    def __init__(self, step: str, error: Exception, results: dict[str, Any]) -> None:
+        super().__init__(f"Step '{step}' failed: {error}")
+        self.step = step
+        self.results = results
+
+
+def validate_steps(steps: list[Step]) -> None:
+    """
+    Validate that the steps form a directed acyclic graph.
+
+    Args:
+        steps (list[Step]): The steps of the pipeline.
+
+    Raises:
+        ValueError: If a step name is repeated, a step requires an unknown step,
+                    or the requirements contain a cycle.
+    """
+    by_name: dict[str, Step] = {}
+    for step in steps:
+        if step.name in by_name:
+            raise ValueError(f"Duplicate step '{step.name}'")
+        by_name[step.name] = step
+    for step in steps:
+        for requirement in step.requires:
+            if requirement not in by_name:
+                raise ValueError(
+                    f"Step '{step.name}' requires unknown step '{requirement}'"
+                )
+
+    resolved: set[str] = set()
+    remaining = list(steps)
+    while remaining:
+        ready = [s for s in remaining if resolved.issuperset(s.requires)]
+        if not ready:
+            names = ", ".join(s.name for s in remaining)
+            raise ValueError(f"Steps {names} have cyclic requirements")
+        resolved.update(s.name for s in ready)
+        remaining = [s for s in remaining if s.name not in resolved]
+
+
+def run_steps(
+    steps: list[Step], max_workers: int | None = None
+) -> tuple[dict[str, Any], dict[str, tuple[float, float]]]:
+    """
+    Run the steps of a pipeline, running independent steps concurrently in a thread pool.
+
+    If a step fails, no further step is started. Steps already running are
+    allowed to finish before the error is raised.
+
+    Args:
+        steps (list[Step]): The steps of the pipeline.
+        max_workers (int | None, optional): The maximum number of steps run at once.
+                                            Defaults to the ThreadPoolExecutor default.
+
+    Returns:
+        tuple[dict[str, Any], dict[str, tuple[float, float]]]: The output of each
+            step, and the start and end time of each step in seconds since the
+            pipeline started.
+
+    Raises:
+        ValueError: If the steps do not form a directed acyclic graph.
+        PipelineError: If a step fails.
+    """
+    validate_steps(steps)
+    started = time.perf_counter()
+    results: dict[str, Any] = {}
+    timings: dict[str, tuple[float, float]] = {}
+    failure: tuple[str, Exception] | None = None
+
+    def run(step: Step, inputs: dict[str, Any]) -> Any:
+        start = time.perf_counter() - started
+        try:
+            return step.func(**inputs)
+        finally:
+            timings[step.name] = (start, time.perf_counter() - started)
+
+    pending = {step.name: step for step in steps}
+    running: dict[Future, Step] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending or running:
+            if failure is None:
+                for step in list(pending.values()):
+                    if all(name in results for name in step.requires):
+                        del pending[step.name]
+                        inputs = {name: results[name] for name in step.requires}
+                        running[executor.submit(run, step, inputs)] = step
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                step = running.pop(future)
+                try:
+                    results[step.name] = future.result()
+                except Exception as e:
+                    failure = failure or (step.name, e)
+
+    if failure is not None:
+        step_name, error = failure
+        raise PipelineError(step_name, error, results) from error
+    return results, timings
+
+
+def get_critical_path(
+    steps: list[Step], timings: dict[str, tuple[float, float]]
+) -> list[str]:
+    """
+    Get the critical path of a finished pipeline run.
+
+    The critical path ends at the step that finished last and follows, at each
+    step, the requirement that finished last. It is the chain of steps that
+    determined the total run time.
+
+    Args:
+        steps (list[Step]): The steps of the pipeline.
+        timings (dict[str, tuple[float, float]]): The timings returned by run_steps.
+
+    Returns:
+        list[str]: The names of the steps on the critical path, in run order.
+    """
+    by_name = {step.name: step for step in steps if step.name in timings}
+    if not by_name:
+        return []
+    current = max(by_name, key=lambda name: timings[name][1])
+    path = [current]
+    while by_name[current].requires:
+        current = max(by_name[current].requires, key=lambda name: timings[name][1])
+        path.append(current)
+    return path[::-1]
+
+
+def print_timings_report(
+    steps: list[Step], timings: dict[str, tuple[float, float]]
+) -> None:
+    """
+    Print the time taken by each step, marking the steps on the critical path.
+
+    Args:
+        steps (list[Step]): The steps of the pipeline.
+        timings (dict[str, tuple[float, float]]): The timings returned by run_steps.
+    """
+    critical_path = get_critical_path(steps, timings)
+    table = Table(title="Timings")
+    table.add_column("Step")
+    table.add_column("Start", justify="right")
+    table.add_column("Duration", justify="right")
+    table.add_column("Critical path", justify="center")
+    for name, (start, end) in sorted(timings.items(), key=lambda item: item[1]):
+        table.add_row(
+            name,
+            f"{start:.3f}s",
+            f"{end - start:.3f}s",
+            "*" if name in critical_path else "",
+        )
+    print(table)
+    total = max((end for _, end in timings.values()), default=0.0)
+    busy = sum(end - start for start, end in timings.values())
+    print(
+        f"[green]Total {total:.3f}s for {busy:.3f}s of work. "
+        f"Critical path: {' -> '.join(critical_path)}[/green]"
+    )
@@ -1,14 +1,16 @@
+import os
 from pathlib import Path
+import secrets
+import shutil
+import sys
 from rich import print
 from fastapi_create.utils import (
-    create_file,
     generate_base_path,
     generate_secret_key,
-    add_key_value_to_env_file,
 )
 
 PROJECT_STRUCTURE = {
-    "": [".env", "README.md", "requirements.txt", "manage.py"],
+    "": [".env", "README.md", "manage.py"],
     "app": ["__init__.py", "main.py"],
     "app/core": ["__init__.py", "config.py", "dependencies.py"],
     "app/core/utils": ["__init__.py", "security.py", "messages.py", "validators.py"],
@@ -18,42 +20,150 @@ PROJECT_STRUCTURE = {
 }
 
 
-def create_skeleton(path_prefix: str | None = None) -> Path:
+class ProjectPlan:
     """
-    Create the FastAPI project skeleton.
+    The full file tree of a project, rendered in memory before anything is written.
 
-    This function generates the base directory structure for a FastAPI project,
-    creates necessary files, and adds a secret key to the .env file.
+    Every configure_*_in_project function adds its files to the plan instead of
+    writing them to disk. Once the plan is complete, write stages it in a
+    temporary directory and renames it into place, so each file is written
+    exactly once and a failed run never leaves a partial project behind.
+
+    Attributes:
+        base_path (Path): The path where the project will be created.
+        files (dict[Path, str]): The content of each file, keyed by path relative to base_path.
+        directories (set[Path]): Directories to create even if they hold no file.
+        env (dict[str, str]): The variables written to the project's .env file.
+    """
+
+    def __init__(self, base_path: Path) -> None:
+        self.base_path = base_path
+        self.files: dict[Path, str] = {}
+        self.directories: set[Path] = set()
+        self.env: dict[str, str] = {}
+
+    def add_file(self, path: str | Path, content: str) -> None:
+        """
+        Add a file to the plan, replacing any content planned for it before.
+
+        Args:
+            path (str | Path): The path of the file relative to the project root.
+            content (str): The content of the file.
+        """
+        self.files[Path(path)] = content
+
+    def add_directory(self, path: str | Path) -> None:
+        """
+        Add a directory to the plan.
+
+        Args:
+            path (str | Path): The path of the directory relative to the project root.
+        """
+        self.directories.add(Path(path))
+
+    def set_env(self, key: str, value: str) -> None:
+        """
+        Set a variable in the project's .env file.
+
+        Args:
+            key (str): The name of the variable.
+            value (str): The value of the variable.
+        """
+        self.env[key] = value
+
+    def render_env(self) -> str:
+        """
+        Render the .env file, quoting values the same way python-dotenv does.
+
+        Returns:
+            str: The content of the .env file.
+        """
+        lines = []
+        for key, value in self.env.items():
+            escaped = value.replace("'", "\\'")
+            lines.append(f"{key}='{escaped}'\n")
+        return "".join(lines)
+
+    def write(self) -> Path:
+        """
+        Write the plan to disk in a single pass.
+
+        The files are written to a temporary directory next to base_path, which
+        is then renamed to base_path. If base_path already exists (it must be
+        empty, e.g. when creating the project in the current directory), the
+        staged entries are moved into it instead.
+
+        Returns:
+            Path: The path to the created project.
+
+        Raises:
+            RuntimeError: If there is an error writing the project.
+        """
+        base_path = self.base_path
+        print(f"[yellow]Writing {len(self.files)} files to {base_path}...[/yellow]")
+        staging_parent = base_path if base_path.is_dir() else base_path.parent
+        staging = None
+        try:
+            # Created with mkdir rather than mkdtemp so the published project
+            # gets the usual umask permissions instead of 0700
+            staging = staging_parent / f".{base_path.name}.{secrets.token_hex(4)}.tmp"
+            staging.mkdir(parents=True)
+            for directory in self.directories:
+                (staging / directory).mkdir(parents=True, exist_ok=True)
+            files = {**self.files, Path(".env"): self.render_env()}
+            for path, content in files.items():
+                (staging / path).parent.mkdir(parents=True, exist_ok=True)
+                (staging / path).write_text(content)
+            if staging_parent == base_path:
+                for entry in staging.iterdir():
+                    os.rename(entry, base_path / entry.name)
+            else:
+                os.rename(staging, base_path)
+        except OSError as e:
+            print(
+                f"[red]Error writing project to {base_path}: {e}[/red]",
+                file=sys.stderr,
+            )
+            raise RuntimeError(f"Error writing project to {base_path}")
+        finally:
+            if staging is not None:
+                shutil.rmtree(staging, ignore_errors=True)
+        print(f"[green]Created project at {base_path.resolve()}[/green]")
+        return base_path
+
+
+def create_skeleton(path_prefix: str | None = None) -> ProjectPlan:
+    """
+    Create the plan of the FastAPI project skeleton.
+
+    This function plans the base directory structure for a FastAPI project,
+    with an empty file for every file in PROJECT_STRUCTURE, and adds a secret
+    key to the .env file. Nothing is written to disk until the plan is written.
 
     Args:
         path_prefix (str | None): Optional prefix for the base path where the project skeleton will be created.
 
     Returns:
-        Path: The path to the created project skeleton.
+        ProjectPlan: The plan of the project skeleton.
     """
-    base_path = generate_base_path(path_prefix)
-    secret_key = generate_secret_key()
-    print("[yellow]Creating project skeleton...[/yellow]")
+    plan = ProjectPlan(generate_base_path(path_prefix))
     for dir_path, files in PROJECT_STRUCTURE.items():
-        directory = base_path / dir_path
-        directory.mkdir(parents=True, exist_ok=True)
         for file_name in files:
-            create_file(directory / file_name, "")
-    add_key_value_to_env_file(base_path / ".env", "SECRET_KEY", secret_key)
-    print(f"[green]Created project skeleton at {base_path.resolve()}[/green]")
-    return base_path
+            plan.add_file(Path(dir_path) / file_name, "")
+    plan.set_env("SECRET_KEY", generate_secret_key())
+    return plan
 
 
-def spin_up_project(project_name: str) -> Path:
+def spin_up_project(project_name: str) -> ProjectPlan:
     """
-    Set up the project directory and skeleton.
+    Set up the plan of the project directory and skeleton.
 
     Args:
         project_name (str): The name of the project directory to create.
                             If the value is ".", the current directory will be used.
 
     Returns:
-        Path: The path to the created project directory.
+        ProjectPlan: The plan of the project.
     """
     msg = "current directory" if project_name == "." else f"'{project_name}'"
     print(f"[yellow]Spinning up a new project in {msg}...[/yellow]")
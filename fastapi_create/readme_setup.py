@@ -1,6 +1,6 @@
-from pathlib import Path
 from rich import print
-from fastapi_create.utils import generate_file_content, write_file
+from fastapi_create.project_setup import ProjectPlan
+from fastapi_create.utils import generate_file_content
 
 
 def generate_readme_code(project_name: str) -> str:
@@ -14,25 +14,21 @@ def generate_readme_code(project_name: str) -> str:
         str: The generated README content.
     """
     print("[yellow]Generating README code...[/yellow]")
-    return generate_file_content("readme_template.md.jinja2", project_name=project_name)
+    return generate_file_content("README_template.md.jinja2", project_name=project_name)
 
 
-def configure_readme_in_project(base_path: Path) -> None:
+def configure_readme_in_project(plan: ProjectPlan) -> None:
     """
     Configure the README.md file in the project.
 
     This function generates the content for the README.md file based on the
-    project's base path name and writes it to the README.md file located at
-    the specified base path.
+    project's base path name and adds it to the README.md file at the root of
+    the project plan.
 
     Args:
-        base_path (Path): The base path of the project where the README.md
-                          file will be created.
+        plan (ProjectPlan): The plan of the project the README.md file is added to.
 
     Returns:
         None
     """
-    readme_path = base_path / "README.md"
-    print("[yellow]Writing README.md to the project...[/yellow]")
-    write_file(readme_path, generate_readme_code(base_path.name))
-    print("[green]README.md written successfully[/green]")
+    plan.add_file("README.md", generate_readme_code(plan.base_path.name))
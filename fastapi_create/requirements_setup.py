@@ -1,17 +1,136 @@
+import json
 from pathlib import Path
 import subprocess
+import sys
+import tempfile
 import typer
 from rich import print
+from fastapi_create.constants import Installer
+from fastapi_create.utils import get_uv_executable, get_wheelhouse_args
 
 
-def generate_requirements_txt(base_path: Path) -> None:
+def format_requirements_lock(report: dict) -> str:
     """
-    Generate the content for a requirements.txt file by freezing the current
-    Python environment's installed packages.
+    Format a pip installation report as a pinned requirements lockfile.
+
+    Every resolved distribution is pinned to its exact version, without
+    hashes. The report only records the archive pip picked for the current
+    interpreter and platform, so its hashes (and its missing environment
+    markers) would make the lockfile fail `pip install --require-hashes` on
+    any other platform, e.g. a Linux image built from a lockfile made on macOS.
+
+    Args:
+        report (dict): A pip installation report, as produced by "pip install --report".
+
+    Returns:
+        str: The content of the lockfile.
+    """
+    lines = []
+    for item in sorted(report["install"], key=lambda i: i["metadata"]["name"].lower()):
+        name = item["metadata"]["name"]
+        extras = item.get("requested_extras")
+        if extras:
+            name = f"{name}[{','.join(sorted(extras))}]"
+        lines.append(f"{name}=={item['metadata']['version']}")
+    return "\n".join(lines) + "\n"
+
+
+def resolve_requirements(
+    dependencies: list[str],
+    installer: Installer = Installer.auto,
+    wheelhouse: Path | None = None,
+) -> str:
+    """
+    Resolve dependencies into a pinned requirements lockfile.
+
+    Only the dependencies and their transitive closure are resolved; packages
+    already installed in the current environment are ignored. uv is used if
+    the installer selects it, and writes a universal lockfile: environment
+    markers are kept and every archive of each pinned version is hashed, so
+    it installs with --require-hashes on any platform. Otherwise pip's dry-run
+    installation report is used, which only covers the current platform, so
+    versions are pinned without hashes and a warning is printed.
+
+    Args:
+        dependencies (list[str]): The top-level dependencies to resolve.
+        installer (Installer, optional): The installer backend to use. Defaults to Installer.auto.
+        wheelhouse (Path | None, optional): A local wheel directory to resolve against without
+                                            network access. Defaults to None.
+
+    Returns:
+        str: The content of the lockfile.
+
+    Raises:
+        subprocess.CalledProcessError: If the resolver fails.
+    """
+    index_args = get_wheelhouse_args(wheelhouse) if wheelhouse else []
+    uv_path = get_uv_executable(installer)
+    if uv_path:
+        result = subprocess.run(
+            [
+                uv_path,
+                "pip",
+                "compile",
+                "-",
+                "--generate-hashes",
+                "--universal",
+                "--no-header",
+                "--quiet",
+                "--python",
+                sys.executable,
+                *index_args,
+            ],
+            input="\n".join(dependencies),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return result.stdout
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        report_path = Path(temp_dir) / "report.json"
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "install",
+                "--dry-run",
+                "--ignore-installed",
+                "--quiet",
+                "--report",
+                str(report_path),
+                *index_args,
+                *dependencies,
+            ],
+            check=True,
+        )
+        report = json.loads(report_path.read_text())
+    print(
+        "[yellow]pip resolves for the current platform only, writing requirements.txt "
+        "without hashes. Install uv for a hashed lockfile usable on every platform.[/yellow]"
+    )
+    return format_requirements_lock(report)
+
+
+def generate_requirements_txt(
+    dependencies: list[str],
+    installer: Installer = Installer.auto,
+    wheelhouse: Path | None = None,
+) -> str:
+    """
+    Generate the content of a requirements.txt lockfile containing only the
+    project dependencies and their transitive closure, pinned to exact versions
+    (with hashes when uv is used, see resolve_requirements).
 
     Args:
-        base_path (Path): The base directory where the requirements.txt file
-                          will be created.
+        dependencies (list[str]): The top-level dependencies of the project.
+        installer (Installer, optional): The installer backend to use. Defaults to Installer.auto.
+        wheelhouse (Path | None, optional): A local wheel directory to resolve against without
+                                            network access. Defaults to None.
+
+    Returns:
+        str: The content of the requirements.txt file.
 
     Raises:
         RuntimeError: If there is an error during the generation of the
@@ -19,9 +138,9 @@ def generate_requirements_txt(base_path: Path) -> None:
     """
     print("[yellow]Generating requirements.txt content...[/yellow]")
     try:
-        with open(base_path / "requirements.txt", "w") as f:
-            subprocess.run(["pip", "freeze"], stdout=f, check=True)
+        requirements = resolve_requirements(dependencies, installer, wheelhouse)
         print("[green]requirements.txt content generated successfully[/green]")
-    except subprocess.CalledProcessError:
-        print("[red]Error generating requirements.txt[/red]", file="stderr")
+    except (subprocess.CalledProcessError, OSError, KeyError, ValueError):
+        print("[red]Error generating requirements.txt[/red]", file=sys.stderr)
         raise RuntimeError("Error generating requirements.txt")
+    return requirements
@@ -1,16 +1,17 @@
 from pathlib import Path
 from typing import Any
+from rich import print
 from rich.prompt import Prompt, Confirm
 from fastapi_create.constants import (
     SMTP_HOST_REGEX,
     SMTP_PORT_REGEX,
     SMTP_USERNAME_REGEX,
 )
+from fastapi_create.project_setup import ProjectPlan
 from fastapi_create.utils import (
     generate_file_content,
+    get_answer,
     recursive_prompt_with_validation,
-    add_key_value_to_env_file,
-    write_file,
 )
 
 
@@ -55,13 +56,22 @@ def validate_smtp_username(username: str) -> bool:
     return bool(SMTP_USERNAME_REGEX.match(username))
 
 
-def smtp_settings_prompt() -> tuple[bool, dict[str, Any] | None]:
+def smtp_settings_prompt(
+    answers: dict[str, Any] | None = None, assume_yes: bool = False
+) -> tuple[bool, dict[str, Any] | None]:
     """
     Prompts the user to enter SMTP settings and returns them as a dictionary.
 
     The function will recursively prompt the user for the SMTP host, port,
     username, and password. It validates the host, port, and username using
-    the respective validation functions.
+    the respective validation functions. Settings provided in answers (under
+    the "smtp", "smtp_host", "smtp_port", "smtp_login" and "smtp_password"
+    keys) are not prompted for. With assume_yes, SMTP is only enabled if an
+    SMTP host is provided.
+
+    Args:
+        answers (dict[str, Any] | None): Answers provided upfront. Defaults to None.
+        assume_yes (bool): Whether to use defaults instead of prompting. Defaults to False.
 
     Returns:
         bool | tuple[bool, dict[str, Any]]: A tuple containing a boolean value
@@ -72,22 +82,49 @@ def smtp_settings_prompt() -> tuple[bool, dict[str, Any] | None]:
             - "smtp_login" (str): The SMTP username.
             - "smtp_password" (str): The SMTP password.
     """
-    smtp_enabled = Confirm.ask("Do you need SMTP setup?", default=True)
+    answers = answers or {}
+    smtp_enabled = get_answer(
+        answers,
+        "smtp",
+        lambda: Confirm.ask("Do you need SMTP setup?", default=True),
+        assume_yes,
+        default="smtp_host" in answers,
+    )
     if not smtp_enabled:
         return False, None
-    smtp_host = recursive_prompt_with_validation(
-        prompt="Enter SMTP host (e.g., smtp.gmail.com)",
+    smtp_host = get_answer(
+        answers,
+        "smtp_host",
+        lambda: recursive_prompt_with_validation(
+            prompt="Enter SMTP host (e.g., smtp.gmail.com)",
+            validation_func=validate_smtp_host,
+            error_msg="Error: Invalid SMTP host",
+        ),
+        assume_yes,
         validation_func=validate_smtp_host,
-        error_msg="Error: Invalid SMTP host",
     )
-    smtp_port = recursive_prompt_with_validation(
-        prompt="Enter SMTP port (e.g., 587)",
-        validation_func=validate_smtp_port,
-        error_msg="Error: Invalid SMTP port",
-        prompt_kwargs={"default": "587"},
+    smtp_port = get_answer(
+        answers,
+        "smtp_port",
+        lambda: recursive_prompt_with_validation(
+            prompt="Enter SMTP port (e.g., 587)",
+            validation_func=validate_smtp_port,
+            error_msg="Error: Invalid SMTP port",
+            prompt_kwargs={"default": "587"},
+        ),
+        assume_yes,
+        default="587",
+        validation_func=lambda value: validate_smtp_port(str(value)),
+    )
+    smtp_username = get_answer(
+        answers, "smtp_login", lambda: Prompt.ask("Enter SMTP username"), assume_yes
+    )
+    smtp_password = get_answer(
+        answers,
+        "smtp_password",
+        lambda: Prompt.ask("Enter SMTP password", password=True),
+        assume_yes,
     )
-    smtp_username = Prompt.ask("Enter SMTP username")
-    smtp_password = Prompt.ask("Enter SMTP password", password=True)
     return True, {
         "smtp_host": smtp_host,
         "smtp_port": int(smtp_port),
@@ -96,15 +133,33 @@ def smtp_settings_prompt() -> tuple[bool, dict[str, Any] | None]:
     }
 
 
-def configure_smtp_settings(base_path: Path) -> bool:
+def write_smtp_settings(plan: ProjectPlan, smtp_settings: dict[str, Any]) -> None:
+    """
+    Add SMTP settings to the .env file of the project plan.
+
+    Args:
+        plan (ProjectPlan): The plan of the project.
+        smtp_settings (dict[str, Any]): The SMTP settings, as returned by smtp_settings_prompt.
+
+    Returns:
+        None
+    """
+    plan.set_env("SMTP_HOST", smtp_settings["smtp_host"])
+    plan.set_env("SMTP_PORT", str(smtp_settings["smtp_port"]))
+    plan.set_env("SMTP_LOGIN", smtp_settings["smtp_login"])
+    plan.set_env("SMTP_PASSWORD", smtp_settings["smtp_password"])
+    print("[green]SMTP settings configured successfully![/green]")
+
+
+def configure_smtp_settings(plan: ProjectPlan) -> bool:
     """
     Configure SMTP settings by prompting the user to enter the required details.
 
     The function prompts the user to enter the SMTP host, port, username, and password.
-    It then adds these settings to the .env file using the add_key_value_to_env_file function.
+    It then adds these settings to the .env file using the write_smtp_settings function.
 
     Args:
-        base_path (Path): The base path of the project where the .env file is located.
+        plan (ProjectPlan): The plan of the project.
 
     Returns:
         bool: A boolean indicating whether SMTP is enabled.
@@ -112,19 +167,7 @@ def configure_smtp_settings(base_path: Path) -> bool:
     smtp_enabled, smtp_settings = smtp_settings_prompt()
     if not smtp_enabled:
         return smtp_enabled
-    add_key_value_to_env_file(
-        base_path / ".env", "SMTP_HOST", smtp_settings["smtp_host"]
-    )
-    add_key_value_to_env_file(
-        base_path / ".env", "SMTP_PORT", str(smtp_settings["smtp_port"])
-    )
-    add_key_value_to_env_file(
-        base_path / ".env", "SMTP_LOGIN", smtp_settings["smtp_login"]
-    )
-    add_key_value_to_env_file(
-        base_path / ".env", "SMTP_PASSWORD", smtp_settings["smtp_password"]
-    )
-    print("[green]SMTP settings configured successfully![/green]")
+    write_smtp_settings(plan, smtp_settings)
     return smtp_enabled
 
 
@@ -143,23 +186,21 @@ def generate_core_messages_code(is_async: bool) -> str:
     return generate_file_content("core_messages_template.py.jinja2", is_async=is_async)
 
 
-def configure_core_messages_in_project(base_path: Path, is_async: bool = True) -> None:
+def configure_core_messages_in_project(plan: ProjectPlan, is_async: bool = True) -> None:
     """
-    Write core messages to the project.
+    Add core messages to the project plan.
 
-    This function generates the core messages code and writes it to the
-    appropriate file within the project directory structure.
+    This function generates the core messages code and adds it to the
+    appropriate file of the project plan.
 
     Args:
-        base_path (Path): The base path of the project where the core messages
-                          file will be created.
+        plan (ProjectPlan): The plan of the project the core messages file
+                            is added to.
         is_async (bool): Whether the application is using asynchronous messages.
                          If True, the messages will be asynchronous. Defaults to True.
 
     Returns:
         None
     """
-    messages_path = base_path / "app" / "core" / "utils" / "messages.py"
-    print("[yellow]Writing core messages to the project...[/yellow]")
-    write_file(messages_path, generate_core_messages_code(is_async))
-    print("[green]Core messages written successfully[/green]")
+    messages_path = Path("app") / "core" / "utils" / "messages.py"
+    plan.add_file(messages_path, generate_core_messages_code(is_async))
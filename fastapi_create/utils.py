@@ -1,14 +1,20 @@
+from functools import lru_cache
 from pathlib import Path
 import secrets
 import shutil
 import subprocess
+import sys
 from typing import Any, Callable, Tuple
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
 import typer
 from rich import print
 from rich.prompt import Prompt
-from dotenv import load_dotenv, set_key
-from fastapi_create.constants import PROJECT_NAME_REGEX
+from fastapi_create.constants import (
+    CACHE_DIR,
+    PROJECT_NAME_REGEX,
+    TEMPLATES_DIR,
+    Installer,
+)
 
 
 def validate_project_name(project_name: str) -> bool:
@@ -54,41 +60,74 @@ def project_name_callback(project_name: str) -> str:
     return project_name
 
 
-def create_file(file_path: Path, content: str) -> None:
+def validate_project_directory(base_path: Path) -> bool:
     """
-    Create a file with the given content, ensuring parent directories exist.
+    Validate that a project can be created at the given path without overwriting anything.
+
+    The path is valid if it does not exist or if it is an empty directory.
 
     Args:
-        file_path (Path): The path where the file will be created.
-        content (str): The content to write to the file.
+        base_path (Path): The path where the project will be created.
 
-    Raises:
-        RuntimeError: If there is an error creating the file.
+    Returns:
+        bool: True if the project can be created at the path, False otherwise.
     """
-    try:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        file_path.write_text(content)
-    except (IOError, OSError) as e:
-        print(f"[red]Error creating file {file_path}: {e}[/red]", file="stderr")
-        raise RuntimeError(f"Error creating file {file_path}")
+    if base_path.exists():
+        if base_path.is_dir() and any(base_path.iterdir()):
+            print(
+                f"[red]Error: Directory '{base_path}' already exists and is not empty. Aborting.[/red]"
+            )
+            return False
+        elif base_path.is_file():
+            print(
+                f"[red]Error: '{base_path}' is a file, not a directory. Aborting.[/red]"
+            )
+            return False
+    return True
 
 
-def write_file(file_path: Path, content: str) -> None:
+def get_answer(
+    answers: dict[str, Any],
+    key: str,
+    prompt_func: Callable[[], Any],
+    assume_yes: bool = False,
+    default: Any = None,
+    validation_func: Callable[[Any], bool] | None = None,
+) -> Any:
     """
-    Write content to a file.
+    Get the answer to a configuration question without prompting when possible.
+
+    The answer is taken from the provided answers if present. Otherwise, if
+    assume_yes is set, the default is used. The user is only prompted when
+    neither applies.
 
     Args:
-        file_path (Path): The path to the file where the content will be written.
-        content (str): The content to write to the file.
+        answers (dict[str, Any]): Answers provided upfront, e.g. from a config file.
+        key (str): The key of the answer in answers.
+        prompt_func (Callable[[], Any]): A function that prompts the user for the answer.
+        assume_yes (bool): Whether to use the default instead of prompting. Defaults to False.
+        default (Any): The answer used when assume_yes is set. None means the answer
+                       has no default and must be provided. Defaults to None.
+        validation_func (Callable[[Any], bool] | None): A function validating provided answers.
+                                                        Defaults to None.
+
+    Returns:
+        Any: The answer.
 
     Raises:
-        RuntimeError: If there is an error writing to the file.
+        ValueError: If a provided answer is invalid, or if assume_yes is set and
+                    an answer without a default is missing.
     """
-    try:
-        file_path.write_text(content)
-    except (IOError, OSError) as e:
-        print(f"[red]Error writing to file {file_path}: {e}[/red]", file="stderr")
-        raise RuntimeError(f"Error writing to file {file_path}")
+    if key in answers:
+        value = answers[key]
+        if validation_func and not validation_func(value):
+            raise ValueError(f"Invalid value for '{key}': {value!r}")
+        return value
+    if assume_yes:
+        if default is None:
+            raise ValueError(f"Missing required answer '{key}'")
+        return default
+    return prompt_func()
 
 
 def generate_secret_key() -> str:
@@ -101,23 +140,32 @@ def generate_secret_key() -> str:
     return secrets.token_hex(32)
 
 
-def add_key_value_to_env_file(env_path: Path, key: str, value: str) -> None:
+@lru_cache(maxsize=None)
+def get_template_environment() -> Environment:
     """
-    Add a key-value pair to a .env file.
+    Get the Jinja2 environment shared by every template rendered during a run.
 
-    This function loads the environment variables from the specified .env file,
-    adds or updates the given key-value pair, and saves the changes back to the file.
-
-    Args:
-        env_path (Path): The path to the .env file.
-        key (str): The key to add or update in the .env file.
-        value (str): The value to associate with the key.
+    The environment is built lazily on first use and then reused, so each
+    template is parsed and compiled at most once per process. Compiled templates
+    are also persisted to a bytecode cache under CACHE_DIR, which lets later runs
+    skip compilation entirely. If the cache directory cannot be created, the
+    environment falls back to the in-memory cache only.
 
     Returns:
-        None
+        Environment: The shared Jinja2 environment.
     """
-    load_dotenv(env_path)
-    set_key(str(env_path), key, value)
+    bytecode_cache = None
+    try:
+        bytecode_cache_dir = CACHE_DIR / "jinja2"
+        bytecode_cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+    except OSError:
+        pass
+    return Environment(
+        loader=FileSystemLoader(TEMPLATES_DIR),
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+    )
 
 
 def generate_file_content(template_name: str, **kwargs) -> str:
@@ -125,7 +173,8 @@ def generate_file_content(template_name: str, **kwargs) -> str:
     Generate file content from a Jinja2 template.
 
     This function loads a Jinja2 template from the "templates" directory located
-    in the same directory as this script, and renders it with the provided keyword
+    in the same directory as this script through the shared environment returned
+    by get_template_environment, and renders it with the provided keyword
     arguments.
 
     Args:
@@ -136,8 +185,7 @@ def generate_file_content(template_name: str, **kwargs) -> str:
         str: The rendered content of the template as a string.
     """
     print(f"[yellow]Generating {template_name.split('_template')[0]} code...[/yellow]")
-    env = Environment(loader=FileSystemLoader(Path(__file__).parent / "templates"))
-    template = env.get_template(template_name)
+    template = get_template_environment().get_template(template_name)
     return template.render(**kwargs)
 
 
@@ -206,10 +254,52 @@ def recursive_prompt_with_validation(
     return user_input
 
 
+def get_uv_executable(installer: Installer = Installer.auto) -> str | None:
+    """
+    Get the uv executable to use for the given installer backend.
+
+    When the installer is "auto", uv is used if it is available on the PATH,
+    otherwise pip is used.
+
+    Args:
+        installer (Installer): The installer backend to use. Defaults to Installer.auto.
+
+    Returns:
+        str | None: The path to the uv executable, or None if pip should be used.
+
+    Raises:
+        RuntimeError: If uv is requested but is not installed.
+    """
+    if installer == Installer.pip:
+        return None
+    uv_path = shutil.which("uv")
+    if installer == Installer.uv and not uv_path:
+        print("[red]Error: uv is not installed[/red]", file=sys.stderr)
+        raise RuntimeError("uv is not installed")
+    return uv_path
+
+
+def get_wheelhouse_args(wheelhouse: Path) -> list[str]:
+    """
+    Get the installer arguments that restrict installs to a local wheelhouse.
+
+    The returned arguments are understood by both pip and uv.
+
+    Args:
+        wheelhouse (Path): The path to the wheelhouse directory.
+
+    Returns:
+        list[str]: The installer arguments.
+    """
+    return ["--no-index", "--find-links", str(wheelhouse.resolve())]
+
+
 def uninstall_dependencies(base_path: Path) -> None:
     """
     Uninstall dependencies listed in the requirements.txt file located at the given base path.
 
+    Nothing is done if the requirements.txt file does not exist.
+
     This function performs the following steps:
     1. Prints a message indicating that dependencies are being uninstalled.
     2. Attempts to uninstall the dependencies listed in the requirements.txt file using pip.
@@ -223,41 +313,48 @@ def uninstall_dependencies(base_path: Path) -> None:
     Raises:
         RuntimeError: If there is an error uninstalling the dependencies.
     """
+    requirements_path = base_path / "requirements.txt"
+    if not requirements_path.exists():
+        # Dependencies were never resolved, so nothing was installed
+        return
     print("[yellow]Uninstalling dependencies...[/yellow]")
     try:
-        requirements_path = base_path / "requirements.txt"
         subprocess.run(
             ["pip", "uninstall", "-r", str(requirements_path), "-y"], check=True
         )
         print("[yellow]Deleting requirements.txt...[/yellow]")
         requirements_path.unlink()
     except subprocess.CalledProcessError:
-        print("[red]Error uninstalling dependencies[/red]", file="stderr")
+        print("[red]Error uninstalling dependencies[/red]", file=sys.stderr)
         raise RuntimeError("Error uninstalling dependencies")
     print("[green]Dependencies uninstalled successfully[/green]")
 
 
-def clean_up(base_path: Path) -> None:
+def clean_up(base_path: Path, uninstall: bool = True) -> None:
     """
     Remove the project directory if an error occurs.
 
     This function performs the following steps:
     1. Checks if the provided base_path exists.
     2. Prints a message indicating the start of the cleanup process.
-    3. Uninstalls any dependencies associated with the project.
+    3. Uninstalls any dependencies associated with the project, unless they
+       were installed into the project's own virtual environment.
     4. Removes the project directory and its contents.
     5. Prints a message indicating the completion of the cleanup process.
 
     Args:
         base_path (Path): The path to the project directory to be removed.
+        uninstall (bool): Whether to uninstall the project dependencies from the
+                          current interpreter. Defaults to True.
 
     Returns:
         None
     """
     if base_path and base_path.exists():
         print("[red]Cleaning up...[/red]")
-        # Uninstall dependencies
-        uninstall_dependencies(base_path)
+        if uninstall:
+            # Uninstall dependencies
+            uninstall_dependencies(base_path)
         print(f"[yellow]Removing {base_path}...[/yellow]")
         shutil.rmtree(base_path, ignore_errors=True)
         print("[green]Clean up complete[/green]")
@@ -0,0 +1,197 @@
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import sys
+import sysconfig
+from typing import Callable
+import venv
+from rich import print
+from fastapi_create.constants import CACHE_DIR
+
+## Name of the virtual environment directory created inside the project
+PROJECT_VENV_NAME = ".venv"
+
+
+def get_venv_python(venv_path: Path) -> Path:
+    """
+    Get the path to the Python interpreter of a virtual environment.
+
+    Args:
+        venv_path (Path): The path to the virtual environment.
+
+    Returns:
+        Path: The path to the virtual environment's Python interpreter.
+    """
+    if os.name == "nt":
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+
+def get_venv_site_packages(venv_path: Path) -> Path:
+    """
+    Get the path to the site-packages directory of a virtual environment.
+
+    Args:
+        venv_path (Path): The path to the virtual environment.
+
+    Returns:
+        Path: The path to the virtual environment's site-packages directory.
+    """
+    kwargs = {"vars": {"base": str(venv_path), "platbase": str(venv_path)}}
+    if "venv" in sysconfig.get_scheme_names():
+        kwargs["scheme"] = "venv"
+    return Path(sysconfig.get_path("purelib", **kwargs))
+
+
+def get_shared_venv_path(dependencies: list[str]) -> Path:
+    """
+    Get the path of the shared cache virtual environment for a set of dependencies.
+
+    The path is derived from the Python version and the dependencies, so every
+    project with the same configuration reuses the same shared environment.
+
+    Args:
+        dependencies (list[str]): The dependencies installed in the environment.
+
+    Returns:
+        Path: The path to the shared virtual environment.
+    """
+    key = "\n".join([sys.version, *sorted(dependencies)])
+    digest = hashlib.sha256(key.encode()).hexdigest()[:16]
+    return CACHE_DIR / "venvs" / digest
+
+
+def ensure_shared_venv(
+    dependencies: list[str], install: Callable[[Path], None]
+) -> Path:
+    """
+    Get the shared cache virtual environment for a set of dependencies, building it if needed.
+
+    The environment is built in a staging directory and renamed into place once
+    the dependencies are installed, so a partially built environment is never
+    reused. If another process publishes the same environment first, the
+    staging directory is discarded.
+
+    Args:
+        dependencies (list[str]): The dependencies installed in the environment.
+        install (Callable[[Path], None]): A function that installs the dependencies
+                                          using the given Python interpreter.
+
+    Returns:
+        Path: The path to the shared virtual environment.
+
+    Raises:
+        RuntimeError: If there is an error creating the virtual environment.
+    """
+    shared_venv = get_shared_venv_path(dependencies)
+    if shared_venv.exists():
+        print(f"[green]Reusing cached environment {shared_venv}[/green]")
+        return shared_venv
+
+    print(f"[yellow]Building cached environment {shared_venv}...[/yellow]")
+    staging = shared_venv.with_name(f"{shared_venv.name}.{os.getpid()}.tmp")
+    try:
+        venv.create(staging, with_pip=True, clear=True)
+        install(get_venv_python(staging))
+        try:
+            staging.rename(shared_venv)
+        except OSError:
+            if not shared_venv.exists():
+                raise
+    except OSError as e:
+        print(f"[red]Error creating cached environment: {e}[/red]", file=sys.stderr)
+        raise RuntimeError("Error creating cached environment")
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    return shared_venv
+
+
+def link_or_copy(src: str, dst: str) -> None:
+    """
+    Hard link a file, falling back to a copy if linking is not possible.
+
+    Args:
+        src (str): The source file.
+        dst (str): The destination file.
+    """
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def link_shared_venv(shared_venv: Path, project_venv: Path) -> None:
+    """
+    Populate a project virtual environment from a shared cache environment.
+
+    The shared site-packages are hard linked into the project environment, so
+    no package has to be downloaded or unpacked again. Console scripts are
+    copied with their shebang pointed at the project interpreter.
+
+    Args:
+        shared_venv (Path): The path to the shared cache environment.
+        project_venv (Path): The path to the project environment.
+    """
+    shutil.copytree(
+        get_venv_site_packages(shared_venv),
+        get_venv_site_packages(project_venv),
+        copy_function=link_or_copy,
+        dirs_exist_ok=True,
+    )
+    project_bin = get_venv_python(project_venv).parent
+    project_python = get_venv_python(project_venv)
+    for script in get_venv_python(shared_venv).parent.iterdir():
+        target = project_bin / script.name
+        if target.exists() or not script.is_file():
+            continue
+        content = script.read_bytes()
+        if content.startswith(b"#!") and b"python" in content.split(b"\n", 1)[0]:
+            body = content.split(b"\n", 1)[1] if b"\n" in content else b""
+            target.write_bytes(b"#!" + str(project_python).encode() + b"\n" + body)
+            shutil.copymode(script, target)
+        else:
+            link_or_copy(str(script), str(target))
+
+
+def create_project_venv(
+    base_path: Path, dependencies: list[str], install: Callable[[Path], None]
+) -> Path:
+    """
+    Create an isolated virtual environment inside the project directory.
+
+    On POSIX systems the environment is populated from a shared cache
+    environment (see ensure_shared_venv and link_shared_venv). On Windows the
+    dependencies are installed directly into the project environment.
+
+    Args:
+        base_path (Path): The base path of the project.
+        dependencies (list[str]): The dependencies to make available in the environment.
+        install (Callable[[Path], None]): A function that installs the dependencies
+                                          using the given Python interpreter.
+
+    Returns:
+        Path: The path to the project environment's Python interpreter.
+
+    Raises:
+        RuntimeError: If there is an error creating the virtual environment.
+    """
+    project_venv = base_path / PROJECT_VENV_NAME
+    print(f"[yellow]Creating virtual environment in {project_venv}...[/yellow]")
+    if os.name == "nt":
+        try:
+            venv.create(project_venv, with_pip=True)
+        except OSError as e:
+            print(f"[red]Error creating virtual environment: {e}[/red]", file=sys.stderr)
+            raise RuntimeError("Error creating virtual environment")
+        install(get_venv_python(project_venv))
+    else:
+        shared_venv = ensure_shared_venv(dependencies, install)
+        try:
+            venv.create(project_venv, with_pip=False, symlinks=True)
+            link_shared_venv(shared_venv, project_venv)
+        except OSError as e:
+            print(f"[red]Error creating virtual environment: {e}[/red]", file=sys.stderr)
+            raise RuntimeError("Error creating virtual environment")
+    print("[green]Virtual environment created successfully[/green]")
+    return get_venv_python(project_venv)
@@ -0,0 +1,65 @@
+from pathlib import Path
+import subprocess
+import sys
+from rich import print
+from fastapi_create.constants import CACHE_DIR
+from fastapi_create.dependency_setup import get_all_dependencies
+
+## Wheelhouse used by --offline when no explicit path is given
+DEFAULT_WHEELHOUSE = CACHE_DIR / "wheelhouse"
+
+
+def validate_wheelhouse(wheelhouse: Path) -> bool:
+    """
+    Validate that the wheelhouse directory exists and contains wheels.
+
+    Args:
+        wheelhouse (Path): The path to the wheelhouse directory.
+
+    Returns:
+        bool: True if the wheelhouse is usable, False otherwise.
+    """
+    if not wheelhouse.is_dir() or not any(wheelhouse.glob("*.whl")):
+        print(
+            f"[red]Error: No wheels found in '{wheelhouse}'. "
+            "Run 'fastapi-create wheelhouse build' to populate it.[/red]"
+        )
+        return False
+    return True
+
+
+def build_wheelhouse(wheelhouse: Path = DEFAULT_WHEELHOUSE) -> None:
+    """
+    Populate a wheelhouse with wheels for every dependency a project may need.
+
+    Wheels are built for the dependencies of every supported combination of
+    options, so that any project can later be created from the wheelhouse
+    without network access.
+
+    Args:
+        wheelhouse (Path): The directory where the wheels will be stored.
+                           Defaults to DEFAULT_WHEELHOUSE.
+
+    Raises:
+        RuntimeError: If there is an error building the wheelhouse.
+    """
+    dependencies = get_all_dependencies()
+    print(f"[yellow]Building wheelhouse in {wheelhouse}...[/yellow]")
+    try:
+        wheelhouse.mkdir(parents=True, exist_ok=True)
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "pip",
+                "wheel",
+                "--wheel-dir",
+                str(wheelhouse),
+                *dependencies,
+            ],
+            check=True,
+        )
+    except (subprocess.CalledProcessError, OSError):
+        print("[red]Error building wheelhouse[/red]", file=sys.stderr)
+        raise RuntimeError("Error building wheelhouse")
+    print(f"[green]Wheelhouse built successfully at {wheelhouse.resolve()}[/green]")